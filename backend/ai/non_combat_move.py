@@ -372,12 +372,13 @@ def decide_non_combat_move(ctx: AIContext):
 
     # Candidates per unit instance: only (from, to) where this unit can reach to (uses remaining_movement).
     from_to_units: dict[tuple[str, str], list[str]] = defaultdict(list)
+    reach_cache: dict = {}  # state is not modified in this loop; same-type units pathfind once
     for unit_info in movable:
         iid = unit_info.get("instance_id")
         if not iid or iid in pending_unit_ids:
             continue
         from_tid = unit_info.get("territory_id")
-        targets, _ = get_unit_move_targets(state, iid, ud, td, fd)  # per-unit reachable set
+        targets, _ = get_unit_move_targets(state, iid, ud, td, fd, reach_cache)  # per-unit reachable set
         for to_tid in (targets or {}).keys():
             if not to_tid or to_tid == from_tid:
                 continue
@@ -746,7 +746,7 @@ def decide_purchase(ctx: AIContext):
             u_e = ud.get(unit_id)
             if u_e and has_unit_special(u_e, "home") and (getattr(u_e, "home_territory_ids", None) or []):
                 open_slots = count_open_home_mobilization_slots_for_unit(
-                    state, faction_id, unit_id, td, cd, port_d, ud
+                    state, faction_id, unit_id, td, cd, port_d, ud, capacity_info
                 )
                 home_rem = open_slots - purchases.get(unit_id, 0)
             score = compute_purchase_score(
@@ -769,7 +769,7 @@ def decide_purchase(ctx: AIContext):
         u_pick = ud.get(best_unit_id)
         if u_pick and has_unit_special(u_pick, "home") and (getattr(u_pick, "home_territory_ids", None) or []):
             open_s = count_open_home_mobilization_slots_for_unit(
-                state, faction_id, best_unit_id, td, cd, port_d, ud
+                state, faction_id, best_unit_id, td, cd, port_d, ud, capacity_info
             )
             # This pick consumes one slot: remaining-before-pick = open_s - (purchases[uid]-1)
             pick_home_rem = open_s - (purchases.get(best_unit_id, 0) - 1)
@@ -11,7 +11,6 @@ import string
 import uuid
 from contextlib import asynccontextmanager
 from copy import deepcopy
-from dataclasses import asdict
 from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Request
@@ -83,6 +82,7 @@ from backend.engine.definitions import (
     load_static_definitions,
     load_starting_setup,
     definitions_from_snapshot,
+    definitions_to_dicts,
     TerritoryDefinition,
     parse_prefire_penalty_from_manifest,
 )
@@ -92,13 +92,13 @@ from backend.setup_data import (
     list_all_setups_admin,
     save_setup_bundle,
     try_list_setups_menu,
+    try_load_combat_definitions,
     try_load_setup,
     try_load_specials,
     try_load_static_definitions,
     try_scenario_display,
 )
 from backend.setup_validation import validate_setup_payload
-from dataclasses import asdict
 from backend.engine.queries import (
     validate_action,
     get_purchasable_units,
@@ -153,14 +153,15 @@ from backend.engine.combat_specials import (
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: init DB, seed setups if empty, sync module default defs from DB when present."""
+    """Startup: init DB, seed setups if empty, preload setup caches and sync module default defs from DB when present."""
     init_db()
-    from backend.setup_data import db_has_any_setup
+    from backend.setup_data import db_has_any_setup, preload_setups_from_db
 
     db = SessionLocal()
     try:
         global unit_defs, territory_defs, faction_defs, camp_defs, port_defs, starting_setup
         if db_has_any_setup(db):
+            preload_setups_from_db(db)
             try:
                 unit_defs, territory_defs, faction_defs, camp_defs, port_defs = try_load_static_definitions(
                     DEFAULT_SETUP_ID, db
@@ -694,11 +695,11 @@ def _build_definitions_snapshot(
     pd = pd if pd is not None else port_defs
     start = start if start is not None else starting_setup
     defs = {
-        "units": {k: asdict(v) for k, v in ud.items()},
-        "territories": {k: asdict(v) for k, v in td.items()},
-        "factions": {k: asdict(v) for k, v in fd.items()},
-        "camps": {k: asdict(v) for k, v in cd.items()},
-        "ports": {k: asdict(v) for k, v in pd.items()},
+        "units": definitions_to_dicts(ud),
+        "territories": definitions_to_dicts(td),
+        "factions": definitions_to_dicts(fd),
+        "camps": definitions_to_dicts(cd),
+        "ports": definitions_to_dicts(pd),
     }
     if specials is not None:
         defs["specials"] = specials
@@ -797,7 +798,8 @@ def save_game(
     db: Session | None = None,
     events: list | None = None,
 ) -> None:
-    """Persist game state to DB and cache. If events is provided, append to config event_log (capped)."""
+    """Persist game state to DB and cache. If events is provided, append to config event_log (capped).
+    Endpoints pass events already serialized with to_dict() and reuse those dicts in the response."""
     from backend.engine.events import GameEvent
 
     games[game_id] = state
@@ -1596,7 +1598,7 @@ def join_game(
 def _safe_asdict_map(defs_dict):
     """Serialize a definitions dict to JSON-serializable form; return {} on any error."""
     try:
-        return {k: asdict(v) for k, v in (defs_dict or {}).items()}
+        return definitions_to_dicts(defs_dict)
     except Exception:
         return {}
 
@@ -1639,7 +1641,7 @@ def simulate_combat(request: SimulateCombatRequest, db: Session = Depends(get_db
     else:
         setup_id = request.setup_id or DEFAULT_SETUP_ID
         try:
-            ud, td, *_ = try_load_static_definitions(setup_id, db)
+            ud, td = try_load_combat_definitions(setup_id, db)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid setup_id: {setup_id}") from e
     # Support generic terrain-only battles: "terrain:forest" etc. Use a real territory with that terrain if available, else inject synthetic.
@@ -2628,10 +2630,11 @@ def do_purchase(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2651,10 +2654,11 @@ def do_purchase_camp(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2675,10 +2679,11 @@ def do_repair_stronghold(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2811,10 +2816,11 @@ def do_move(
                 primary_unit_id=primary_unit_id,
             )
             state_after_sail.pending_moves = list(state_after_sail.pending_moves) + [offload_pending]
-            save_game(game_id, state_after_sail, db, events_sail)
+            event_dicts_sail = [e.to_dict() for e in events_sail]
+            save_game(game_id, state_after_sail, db, event_dicts_sail)
             return {
                 "state": state_for_response(state_after_sail, game_id, db),
-                "events": [e.to_dict() for e in events_sail],
+                "events": event_dicts_sail,
                 "can_act": _player_can_act(game_id, player, db),
             }
         # Boat already in a valid adjacent sea zone; single offload move
@@ -2834,10 +2840,11 @@ def do_move(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2858,10 +2865,11 @@ def do_cancel_move(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2882,10 +2890,11 @@ def do_cancel_mobilization(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2906,10 +2915,11 @@ def do_place_camp(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2930,10 +2940,11 @@ def do_queue_camp_placement(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -2954,10 +2965,11 @@ def do_cancel_camp_placement(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3269,10 +3281,11 @@ def do_initiate_combat(
         raise HTTPException(status_code=400, detail=validation.error)
 
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     response: dict[str, Any] = {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "dice_rolls": payload["dice_rolls"],
         "can_act": _player_can_act(game_id, player, db),
     }
@@ -3463,10 +3476,11 @@ def do_continue_combat(
         raise HTTPException(status_code=400, detail=validation.error)
 
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     response: dict[str, Any] = {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "dice_rolls": dice_rolls,
         "can_act": _player_can_act(game_id, player, db),
     }
@@ -3492,10 +3506,11 @@ def do_retreat(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3520,10 +3535,11 @@ def do_set_territory_defender_casualty_order(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3546,10 +3562,11 @@ def do_mobilize(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3571,10 +3588,11 @@ def do_end_phase(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3597,10 +3615,11 @@ def do_end_turn(
         raise HTTPException(status_code=400, detail=validation.error)
 
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3620,10 +3639,11 @@ def do_skip_turn(
     if not validation.valid:
         raise HTTPException(status_code=400, detail=validation.error)
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "can_act": _player_can_act(game_id, player, db),
     }
 
@@ -3873,18 +3893,20 @@ def do_ai_step(
                     new_state, events = apply_action(
                         state, fallback_action, ud, td, fd, cd, port_d
                     )
-                    save_game(game_id, new_state, db, events)
+                    event_dicts = [e.to_dict() for e in events]
+                    save_game(game_id, new_state, db, event_dicts)
                     return {
                         "state": state_for_response(new_state, game_id, db),
-                        "events": [e.to_dict() for e in events],
+                        "events": event_dicts,
                         "action_type": fallback_action.type,
                     }
         raise HTTPException(status_code=400, detail=validation.error or "AI action invalid")
     new_state, events = apply_action(state, action, ud, td, fd, cd, port_d)
-    save_game(game_id, new_state, db, events)
+    event_dicts = [e.to_dict() for e in events]
+    save_game(game_id, new_state, db, event_dicts)
     return {
         "state": state_for_response(new_state, game_id, db),
-        "events": [e.to_dict() for e in events],
+        "events": event_dicts,
         "action_type": action.type,
     }
 
@@ -3,7 +3,12 @@ Action definitions for the game.
 Actions are immutable, deterministic instructions.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from types import MappingProxyType
+
+# Shared read-only payload for parameterless actions (end_phase, end_turn, ...); avoids a new dict per action.
+_EMPTY_PAYLOAD = MappingProxyType({})
 
 
 @dataclass
@@ -11,7 +16,7 @@ class Action:
     """Base action class. All actions have a type, faction, and payload."""
     type: str  # e.g., "purchase_units", "move_units", "initiate_combat", "end_phase", "end_turn"
     faction: str  # faction_id performing the action
-    payload: dict  # Action-specific data
+    payload: dict  # Action-specific data (parameterless actions share the read-only _EMPTY_PAYLOAD)
 
 
 def purchase_camp(faction: str) -> Action:
@@ -20,7 +25,7 @@ def purchase_camp(faction: str) -> Action:
     Camp is added to pending_camps; territory_options are territories owned at turn start without a camp.
     Placement happens in mobilization phase via place_camp.
     """
-    return Action(type="purchase_camp", faction=faction, payload={})
+    return Action(type="purchase_camp", faction=faction, payload=_EMPTY_PAYLOAD)
 
 
 def purchase_units(
@@ -58,8 +63,8 @@ def move_units(
     faction: str,
     territory_from: str,
     territory_to: str,
-    unit_instance_ids: list[str],  # List of unit instance_ids to move
-    charge_through: list[str] | None = None,  # Cavalry: empty enemy territory IDs to conquer (order)
+    unit_instance_ids: Sequence[str],  # Unit instance_ids to move (frozen to a tuple in the payload)
+    charge_through: Sequence[str] | None = None,  # Cavalry: empty enemy territory IDs to conquer (order)
     move_type: str | None = None,  # "load" | "offload" | "sail" for sea transport; None = normal move
     load_onto_boat_instance_id: str | None = None,  # Load: assign passengers only to this boat in destination sea zone
     sail_to_offload_land_territory_id: str | None = None,  # sea→sea sail only: land hex you will offload/raid onto (server-only)
@@ -68,6 +73,7 @@ def move_units(
     """
     Move units from one territory to another.
     Units are specified by their instance_ids for granular control.
+    unit_instance_ids and charge_through are copied into tuples, so later changes to the caller's lists do not leak in.
     charge_through: for cavalry charging, list of empty enemy territory IDs passed through (conquered when move is applied).
     move_type: "load" = land units boarding adjacent sea (cost 1 to passengers); "offload" = land units disembarking to adjacent land (cost 0); "sail" = boats moving with passengers (cost 0 to passengers, path cost to drivers). Omit for normal land moves.
     load_onto_boat_instance_id: when loading to sea, assign moved passengers only to this boat (must exist in destination and have capacity).
@@ -76,10 +82,10 @@ def move_units(
     payload = {
         "from": territory_from,
         "to": territory_to,
-        "unit_instance_ids": unit_instance_ids,
+        "unit_instance_ids": tuple(unit_instance_ids),
     }
     if charge_through:
-        payload["charge_through"] = charge_through
+        payload["charge_through"] = tuple(charge_through)
     if move_type:
         payload["move_type"] = move_type
     if load_onto_boat_instance_id:
@@ -317,7 +323,7 @@ def end_phase(faction: str) -> Action:
     return Action(
         type="end_phase",
         faction=faction,
-        payload={},
+        payload=_EMPTY_PAYLOAD,
     )
 
 
@@ -326,10 +332,10 @@ def end_turn(faction: str) -> Action:
     return Action(
         type="end_turn",
         faction=faction,
-        payload={},
+        payload=_EMPTY_PAYLOAD,
     )
 
 
 def skip_turn(faction: str) -> Action:
     """Force end current faction's turn from any phase. Used by forfeit when a player leaves on their turn."""
-    return Action(type="skip_turn", faction=faction, payload={})
+    return Action(type="skip_turn", faction=faction, payload=_EMPTY_PAYLOAD)
@@ -7,9 +7,10 @@ Defender units with the archer special can prefire before round 1 at defense-1.
 Terrain bonuses: units with tag matching terrain get +stat (from terrain_bonuses table).
 """
 
+import heapq
 from dataclasses import dataclass, field
-from copy import deepcopy
-from itertools import groupby
+from itertools import chain, groupby, islice, repeat
+from operator import and_, attrgetter, le
 from typing import TYPE_CHECKING
 
 from backend.engine.state import Unit, CombatRoundResult
@@ -36,6 +37,36 @@ SIEGEWORK_SPECIAL_RAM = "ram"
 # Does not roll; allows 2 infantry (worst to best) to roll toward defender units, bypassing stronghold HP
 SIEGEWORK_SPECIAL_LADDER = "ladder"
 
+# Combat stat accessors, chosen once per call instead of getattr(unit_def, stat_name) per unit
+_attack_of = attrgetter("attack")
+_defense_of = attrgetter("defense")
+
+
+def _combat_stat_getter(is_attacker: bool):
+    """Return the attack (attacker) or defense (defender) accessor for unit definitions."""
+    return _attack_of if is_attacker else _defense_of
+
+
+def clone_unit(unit: Unit) -> Unit:
+    """
+    Copy a Unit for combat resolution. Unit holds only scalars/strings, so a field-wise
+    constructor call is equivalent to deepcopy without its memo/reduce overhead.
+    """
+    return Unit(
+        instance_id=unit.instance_id,
+        unit_id=unit.unit_id,
+        remaining_movement=unit.remaining_movement,
+        remaining_health=unit.remaining_health,
+        base_movement=unit.base_movement,
+        base_health=unit.base_health,
+        loaded_onto=unit.loaded_onto,
+    )
+
+
+def clone_units(units: list[Unit]) -> list[Unit]:
+    """Copy a list of Units (see clone_unit); use before resolve_combat_round to keep the originals intact."""
+    return [clone_unit(u) for u in units]
+
 
 def _is_siegework_unit(unit_def: UnitDefinition | None) -> bool:
     """True if unit is siegework (archetype). Siegework units only roll in the dedicated siegeworks round."""
@@ -101,11 +132,9 @@ def get_ladder_infantry_instance_ids(
         ud = unit_defs.get(unit.unit_id)
         if not ud:
             return (0, 0, 0, unit.unit_id or "")
-        cost_dict = getattr(ud, "cost", None) or {}
-        total_cost = sum(cost_dict.values()) if isinstance(
-            cost_dict, dict) else 0
-        attack = getattr(ud, "attack", 0)
-        specials_list = getattr(ud, "specials", None) or []
+        total_cost = ud.total_cost
+        attack = ud.attack
+        specials_list = ud.specials or []
         num_specials = len(specials_list) if isinstance(
             specials_list, list) else 0
         return (total_cost, attack, num_specials, unit.unit_id or "")
@@ -218,9 +247,7 @@ def _is_naval_unit(unit_def: UnitDefinition | None) -> bool:
     """True if unit is naval (ship/boat). Used for naval combat casualty order (cargo value)."""
     if not unit_def:
         return False
-    arch = getattr(unit_def, "archetype", "") or ""
-    tags = getattr(unit_def, "tags", []) or []
-    return arch == "naval" or "naval" in tags
+    return unit_def.archetype == "naval" or "naval" in (unit_def.tags or [])
 
 
 # Tags that do NOT count as specials (match frontend getUnitSpecials: exclude land, mounted).
@@ -276,21 +303,35 @@ def compute_terrain_stat_modifiers(
             return has_unit_special(unit_def, "mountain") or has_unit_special(unit_def, "mountains")
         return has_unit_special(unit_def, terr)
 
+    # unit_id -> gets the bonus; tags are per type, so each type is checked once for both sides
+    type_has_tag: dict[str, bool] = {}
+
+    def gets_bonus(unit_id: str) -> bool:
+        has_tag = type_has_tag.get(unit_id)
+        if has_tag is None:
+            has_tag = type_has_tag[unit_id] = unit_has_terrain_tag(unit_defs.get(unit_id), terrain)
+        return has_tag
+
     def apply_for_units(units: list[Unit]) -> dict[str, int]:
-        mods: dict[str, int] = {}
-        for unit in units:
-            unit_def = unit_defs.get(unit.unit_id)
-            if not unit_def:
-                continue
-            if unit_has_terrain_tag(unit_def, terrain):
-                mods[unit.instance_id] = bonus
-        return mods
+        return {unit.instance_id: bonus for unit in units if gets_bonus(unit.unit_id)}
 
     attacker_mods = apply_for_units(attacker_units)
     defender_mods = apply_for_units(defender_units)
     return attacker_mods, defender_mods
 
 
+def _unit_types_with_special(
+    units: list[Unit],
+    unit_defs: dict[str, UnitDefinition],
+    special: str,
+) -> set[str]:
+    """unit_ids among units whose definition has the special; each distinct type is checked once."""
+    return {
+        unit_id for unit_id in {u.unit_id for u in units}
+        if has_unit_special(unit_defs.get(unit_id), special)
+    }
+
+
 def compute_anti_cavalry_stat_modifiers(
     attacker_units: list[Unit],
     defender_units: list[Unit],
@@ -316,37 +357,32 @@ def compute_anti_cavalry_stat_modifiers(
         n = 0
         for unit in units:
             unit_def = unit_defs.get(unit.unit_id)
-            if unit_def and getattr(unit_def, "archetype", "") == ARCHETYPE_CAVALRY:
+            if unit_def and unit_def.archetype == ARCHETYPE_CAVALRY:
                 n += 1
         return n
 
     def apply_for_side(
         side_units: list[Unit],
-        enemy_cavalry_count: int,
-        relevant_stat_name: str,
+        anti_cavalry_types: set[str],
+        enemy_units: list[Unit],
+        stat_of,
     ) -> dict[str, int]:
-        if enemy_cavalry_count <= 0:
+        if not anti_cavalry_types:
             return {}
-        if not side_units:
+        enemy_cavalry_count = count_cavalry(enemy_units)
+        if enemy_cavalry_count <= 0:
             return {}
 
-        candidates = [
-            u
-            for u in side_units
-            if has_unit_special(unit_defs.get(u.unit_id), "anti_cavalry")
-        ]
-        if not candidates:
-            return {}
+        candidates = [u for u in side_units if u.unit_id in anti_cavalry_types]
 
         def key(u: Unit) -> tuple:
             ud = unit_defs.get(u.unit_id)
             if not ud:
                 return (float("inf"), 0, 0, u.instance_id or "")
-            c = getattr(ud, "cost", None) or {}
-            cost = sum(c.values()) if isinstance(c, dict) else 0
-            st = getattr(ud, relevant_stat_name, 0)
-            sp = getattr(ud, "specials", None) or []
-            tags = getattr(ud, "tags", None) or []
+            cost = ud.total_cost
+            st = stat_of(ud)
+            sp = ud.specials or []
+            tags = ud.tags or []
             num_specials = len(sp) if isinstance(sp, list) else 0
             num_specials += len([t for t in tags if t not in sp]) if isinstance(tags, list) else 0
             return (cost, st, num_specials, u.instance_id or "")
@@ -357,14 +393,16 @@ def compute_anti_cavalry_stat_modifiers(
             mods[u.instance_id] = bonus
         return mods
 
-    defender_cavalry_count = count_cavalry(defender_units)
-    attacker_cavalry_count = count_cavalry(attacker_units)
+    # Most battles have no anti-cavalry unit: test each distinct unit type once and skip the
+    # cavalry count and candidate pass for a side that has none.
+    attacker_anti_cavalry = _unit_types_with_special(attacker_units, unit_defs, "anti_cavalry")
+    defender_anti_cavalry = _unit_types_with_special(defender_units, unit_defs, "anti_cavalry")
 
     # Anti-cavalry boosts:
     # - attacker-side anti-cavalry boosts attack when defender has cavalry
     # - defender-side anti-cavalry boosts defense when attacker has cavalry
-    attacker_mods = apply_for_side(attacker_units, defender_cavalry_count, "attack")
-    defender_mods = apply_for_side(defender_units, attacker_cavalry_count, "defense")
+    attacker_mods = apply_for_side(attacker_units, attacker_anti_cavalry, defender_units, _attack_of)
+    defender_mods = apply_for_side(defender_units, defender_anti_cavalry, attacker_units, _defense_of)
     return attacker_mods, defender_mods
 
 
@@ -389,53 +427,62 @@ def compute_captain_stat_modifiers(
     def _has_captain(ud: UnitDefinition | None) -> bool:
         return has_unit_special(ud, "captain")
 
-    def apply_for_side(units: list[Unit], stat_name: str) -> dict[str, int]:
+    def apply_for_side(units: list[Unit], stat_of) -> dict[str, int]:
         mods: dict[str, int] = {}
         boosted: set[str] = set()
-        captains = [u for u in units if _has_captain(unit_defs.get(u.unit_id))]
+        captains: list[Unit] = []
+        # Non-captain allies bucketed by archetype, built in one pass; each bucket is sorted once below.
+        allies_by_archetype: dict[str, list[Unit]] = {}
+        for u in units:
+            ud = unit_defs.get(u.unit_id)
+            if _has_captain(ud):
+                captains.append(u)
+            else:
+                allies_by_archetype.setdefault(getattr(ud, "archetype", ""), []).append(u)
+        if not captains:
+            return mods
         captains.sort(key=lambda u: u.instance_id or "")
+
+        # Sort: cost asc, stat asc, specials count asc, instance_id
+        def key(u: Unit) -> tuple:
+            ud = unit_defs.get(u.unit_id)
+            if not ud:
+                return (float("inf"), 0, 0, u.instance_id or "")
+            cost = ud.total_cost
+            st = stat_of(ud)
+            sp = ud.specials or []
+            tags = ud.tags or []
+            num_specials = len(sp) if isinstance(sp, list) else 0
+            num_specials += len([t for t in tags if t not in sp]
+                                ) if isinstance(tags, list) else 0
+            return (cost, st, num_specials, u.instance_id or "")
+
+        sorted_archetypes: set[str] = set()
         for captain_unit in captains:
             unit_def = unit_defs.get(captain_unit.unit_id)
             if not unit_def:
                 continue
-            archetype = getattr(unit_def, "archetype", "")
+            archetype = unit_def.archetype
             # Same-archetype allies (excluding captains), not already boosted
-            candidates = [
-                u for u in units
-                if u.instance_id != captain_unit.instance_id
-                and u.instance_id not in boosted
-                and not _has_captain(unit_defs.get(u.unit_id))
-            ]
-            # Same archetype only
-            candidates = [u for u in candidates if getattr(
-                unit_defs.get(u.unit_id), "archetype", "") == archetype]
-            # Sort: cost asc, stat asc, specials count asc, instance_id
-
-            def key(u: Unit) -> tuple:
-                ud = unit_defs.get(u.unit_id)
-                if not ud:
-                    return (float("inf"), 0, 0, u.instance_id or "")
-                c = getattr(ud, "cost", None) or {}
-                cost = sum(c.values()) if isinstance(c, dict) else 0
-                st = getattr(ud, stat_name, 0)
-                sp = getattr(ud, "specials", None) or []
-                tags = getattr(ud, "tags", None) or []
-                num_specials = len(sp) if isinstance(sp, list) else 0
-                num_specials += len([t for t in tags if t not in sp]
-                                    ) if isinstance(tags, list) else 0
-                return (cost, st, num_specials, u.instance_id or "")
-            candidates.sort(key=key)
+            candidates = allies_by_archetype.get(archetype)
+            if not candidates:
+                continue
+            if archetype not in sorted_archetypes:
+                candidates.sort(key=key)
+                sorted_archetypes.add(archetype)
             count = 0
             for ally in candidates:
                 if count >= max_allies:
                     break
+                if ally.instance_id in boosted or ally.instance_id == captain_unit.instance_id:
+                    continue
                 mods[ally.instance_id] = bonus
                 boosted.add(ally.instance_id)
                 count += 1
         return mods
 
-    attacker_mods = apply_for_side(attacker_units, "attack")
-    defender_mods = apply_for_side(defender_units, "defense")
+    attacker_mods = apply_for_side(attacker_units, _attack_of)
+    defender_mods = apply_for_side(defender_units, _defense_of)
     return attacker_mods, defender_mods
 
 
@@ -468,11 +515,15 @@ def compute_sea_raider_stat_modifiers(
 def merge_stat_modifiers(*mod_dicts: dict[str, int] | None) -> dict[str, int]:
     """Merge multiple modifier dicts by adding values for same instance_id."""
     result: dict[str, int] = {}
+    get = result.get
     for d in mod_dicts:
         if not d:
             continue
+        if not result:
+            result.update(d)  # first non-empty dict: plain copy, no per-key add
+            continue
         for iid, val in d.items():
-            result[iid] = result.get(iid, 0) + val
+            result[iid] = get(iid, 0) + val
     return result
 
 
@@ -511,6 +562,7 @@ def resolve_combat_round(
     defender_territory_is_stronghold: bool = False,
     exclude_archetypes_from_rolling: list[str] | None = None,
     attacker_ladder_instance_ids: set[str] | None = None,
+    out: RoundResult | None = None,
 ) -> tuple[RoundResult, int | None]:
     """
     Resolve a single combat round.
@@ -526,6 +578,10 @@ def resolve_combat_round(
       1. remaining_health desc (soak hits with high health units)
       2. cost asc (lose cheap units first)
       3. attack/defense asc, num_specials asc, remaining_movement asc, instance_id (tiebreaker)
+    - out: optional RoundResult from a previous round to refill in place instead of allocating a new one
+      (simulators that consume each round before resolving the next); its survivor lists keep their storage.
+    - attacker_units / defender_units are mutated (remaining_health, casualty order); pass clone_units(...)
+      copies when the originals must stay intact.
 
     Returns:
         (RoundResult, defender_stronghold_hp_after) — hp_after is None if stronghold not in use.
@@ -620,6 +676,19 @@ def resolve_combat_round(
         attacker_units[:] = [
             u for u in attacker_units if u.instance_id not in self_destruct_set]
 
+    if out is not None:
+        out.attacker_hits = attacker_hits
+        out.defender_hits = defender_hits
+        out.attacker_casualties = attacker_casualties
+        out.defender_casualties = defender_casualties
+        out.attacker_wounded = attacker_wounded
+        out.defender_wounded = defender_wounded
+        out.surviving_attacker_ids[:] = [u.instance_id for u in attacker_units]
+        out.surviving_defender_ids[:] = [u.instance_id for u in defender_units]
+        out.attackers_eliminated = len(attacker_units) == 0
+        out.defenders_eliminated = len(defender_units) == 0
+        return out, defender_stronghold_hp_after
+
     result = RoundResult(
         attacker_hits=attacker_hits,
         defender_hits=defender_hits,
@@ -635,6 +704,55 @@ def resolve_combat_round(
     return result, defender_stronghold_hp_after
 
 
+def _rolling_unit_stats(
+    units: list[Unit],
+    unit_defs: dict[str, UnitDefinition],
+    is_attacker: bool,
+    stat_modifiers: dict[str, int] | None = None,
+    effective_dice_override: dict[str, int] | None = None,
+    effective_stat_override: dict[str, int] | None = None,
+    exclude_archetypes: set[str] | None = None,
+) -> list[tuple[Unit, UnitDefinition, int, int]]:
+    """
+    (unit, unit_def, stat_value, dice_count) for each unit that rolls, in roll order.
+    Units without a definition or with an excluded archetype are skipped (they consume no dice).
+    """
+    stat_of = _combat_stat_getter(is_attacker)
+    mods = stat_modifiers or {}
+    stat_override = effective_stat_override or {}
+    skip_archetypes = exclude_archetypes or ()
+    # unit_id -> (unit_def, base roll stat, dice) or None if that type does not roll; the attack/defense
+    # choice is made here once per type, so the per-unit work is only modifiers and overrides.
+    type_stats: dict[str, tuple[UnitDefinition, int, int] | None] = {}
+    out = []
+    for unit in units:
+        unit_id = unit.unit_id
+        if unit_id in type_stats:
+            entry = type_stats[unit_id]
+        else:
+            unit_def = unit_defs.get(unit_id)
+            if not unit_def or unit_def.archetype in skip_archetypes:
+                entry = None
+            else:
+                entry = (unit_def, stat_of(unit_def), unit_def.dice)
+            type_stats[unit_id] = entry
+        if entry is None:
+            continue
+        unit_def, base_stat, dice = entry
+        iid = unit.instance_id
+        dice_count = (
+            effective_dice_override.get(iid, dice)
+            if effective_dice_override is not None
+            else dice
+        )
+        if iid in stat_override:
+            stat_value = stat_override[iid]
+        else:
+            stat_value = base_stat + mods.get(iid, 0)
+        out.append((unit, unit_def, stat_value, dice_count))
+    return out
+
+
 def _count_hits(
     units: list[Unit],
     rolls: list[int],
@@ -655,46 +773,17 @@ def _count_hits(
     When exclude_archetypes is set (e.g. {"siegework"}), those units do not roll this round:
     they do not consume dice and do not contribute hits.
     """
-    stat_name = "attack" if is_attacker else "defense"
-    mods = stat_modifiers or {}
-    stat_override = effective_stat_override or {}
-    skip_archetypes = exclude_archetypes or set()
-
-    hits = 0
-    roll_idx = 0
-
-    for unit in units:
-        unit_def = unit_defs.get(unit.unit_id)
-        if not unit_def:
-            continue
-
-        if getattr(unit_def, "archetype", "") in skip_archetypes:
-            continue
-
-        dice_count = (
-            effective_dice_override.get(
-                unit.instance_id, getattr(unit_def, "dice", 1))
-            if effective_dice_override is not None
-            else getattr(unit_def, "dice", 1)
-        )
-
-        if unit.instance_id in stat_override:
-            stat_value = stat_override[unit.instance_id]
-        else:
-            stat_value = getattr(unit_def, stat_name, 0) + \
-                mods.get(unit.instance_id, 0)
-
-        for _ in range(dice_count):
-            if roll_idx >= len(rolls):
-                break
-            if rolls[roll_idx] <= stat_value:
-                hits += 1
-            roll_idx += 1
-
-    assert hits <= roll_idx <= len(rolls), (
-        f"Combat roll mismatch: hits={hits} roll_idx={roll_idx} len(rolls)={len(rolls)}"
+    rolling = _rolling_unit_stats(
+        units, unit_defs, is_attacker,
+        stat_modifiers=stat_modifiers,
+        effective_dice_override=effective_dice_override,
+        effective_stat_override=effective_stat_override,
+        exclude_archetypes=exclude_archetypes,
     )
-    return hits
+    # One threshold per die, aligned with rolls; extra thresholds (too few rolls) are ignored by map()
+    thresholds = chain.from_iterable(
+        repeat(stat_value, dice_count) for _, _, stat_value, dice_count in rolling)
+    return sum(map(le, rolls, thresholds))
 
 
 def _count_hits_split(
@@ -712,48 +801,181 @@ def _count_hits_split(
     Like _count_hits but returns (hits_from_ladder_units, hits_from_other_units).
     Only used for attacker when ladder_instance_ids is non-empty (ladder infantry bypass stronghold).
     """
-    stat_name = "attack" if is_attacker else "defense"
-    mods = stat_modifiers or {}
-    stat_override = effective_stat_override or {}
-    skip_archetypes = exclude_archetypes or set()
-    ladder_hits = 0
-    other_hits = 0
-    roll_idx = 0
-
-    for unit in units:
-        unit_def = unit_defs.get(unit.unit_id)
-        if not unit_def:
-            continue
+    rolling = _rolling_unit_stats(
+        units, unit_defs, is_attacker,
+        stat_modifiers=stat_modifiers,
+        effective_dice_override=effective_dice_override,
+        effective_stat_override=effective_stat_override,
+        exclude_archetypes=exclude_archetypes,
+    )
+    thresholds = chain.from_iterable(
+        repeat(stat_value, dice_count) for _, _, stat_value, dice_count in rolling)
+    on_ladder = chain.from_iterable(
+        repeat(unit.instance_id in ladder_instance_ids, dice_count) for unit, _, _, dice_count in rolling)
+    hit_mask = list(map(le, rolls, thresholds))
+    ladder_hits = sum(map(and_, hit_mask, on_ladder))
+    return ladder_hits, sum(hit_mask) - ladder_hits
 
-        if getattr(unit_def, "archetype", "") in skip_archetypes:
-            continue
 
-        dice_count = (
-            effective_dice_override.get(
-                unit.instance_id, getattr(unit_def, "dice", 1))
-            if effective_dice_override is not None
-            else getattr(unit_def, "dice", 1)
+@dataclass
+class UnitBatch:
+    """
+    Struct-of-arrays view of one combat side, used for casualty assignment.
+
+    Casualty priority only depends on remaining_health plus per-unit fields that cannot change
+    while hits are being applied (stronghold lead, cost, effective stat, cargo, specials,
+    remaining_movement, instance_id). Those are ranked once and packed with the health term into
+    a single int per unit, so comparing two units during hit assignment is one int comparison
+    (see priority()). Parallel columns are indexed the same as units; write_back() reconciles
+    health onto the Units.
+    """
+    units: list[Unit]
+    instance_ids: list[str]
+    remaining_health: list[int]
+    priority_base: list[int]  # packed (lead, health offset, static rank); priority subtracts the health term
+    health_weight: list[int]  # per-HP step of the packed key (0 for units without a definition: fixed health key)
+    can_conquer: list[bool]
+    is_aerial: list[bool]
+    is_siegework: list[bool]
+
+    @classmethod
+    def from_units(
+        cls,
+        units: list[Unit],
+        unit_defs: dict[str, UnitDefinition],
+        is_attacker: bool,
+        stat_modifiers: dict[str, int] | None = None,
+        casualty_order: str = "best_unit",
+        is_naval_combat: bool = False,
+        stronghold_sort: int = 0,
+        all_units: list[Unit] | None = None,
+        hits: int = 0,
+    ) -> "UnitBatch":
+        """
+        Build columns for units; all_units (defaults to units) is scanned for naval cargo.
+        hits is how many hits will be applied, so the packed key leaves room for units already
+        at 0 HP or below, which keep taking hits without being destroyed.
+        """
+        stat_of = _combat_stat_getter(is_attacker)
+        mods = stat_modifiers or {}
+        use_stat_before_cost = casualty_order in ("best_attack", "best_defense")
+        cargo_pool = all_units if all_units is not None else units
+
+        def _cargo_sort_key(boat_unit: Unit) -> tuple[int, int, tuple[int, ...]]:
+            """Naval: (cargo_value_sum, num_passengers, tuple(sorted passenger costs)). Asc = sink low-value first."""
+            boat_id = boat_unit.instance_id or ""
+            costs: list[int] = []
+            for u in cargo_pool:
+                if getattr(u, "loaded_onto", None) != boat_id:
+                    continue
+                ud = unit_defs.get(u.unit_id)
+                if not ud:
+                    continue
+                costs.append(ud.total_cost)
+            costs.sort()
+            return (sum(costs), len(costs), tuple(costs))
+
+        batch = cls(
+            units=list(units),
+            instance_ids=[],
+            remaining_health=[],
+            priority_base=[],
+            health_weight=[],
+            can_conquer=[],
+            is_aerial=[],
+            is_siegework=[],
         )
-        on_ladder = unit.instance_id in ladder_instance_ids
-
-        if unit.instance_id in stat_override:
-            stat_value = stat_override[unit.instance_id]
-        else:
-            stat_value = getattr(unit_def, stat_name, 0) + \
-                mods.get(unit.instance_id, 0)
-
-        for _ in range(dice_count):
-            if roll_idx >= len(rolls):
-                break
-            if rolls[roll_idx] <= stat_value:
-                if on_ladder:
-                    ladder_hits += 1
+        # Per unit type (and modifier): flags and the (cost, stat) part of the key are shared by every
+        # unit of that type, so definitions are looked up once per type rather than once per unit.
+        type_columns: dict[tuple[str, int], tuple] = {}
+        lead_keys: list[int] = []  # stronghold sort key (0 for units without a definition)
+        health_ranked: list[bool] = []  # False for units without a definition (legacy key uses fixed -1)
+        static_keys: list[tuple] = []
+        for unit in batch.units:
+            iid = unit.instance_id or ''
+            type_key = (unit.unit_id, mods.get(iid, 0))
+            columns = type_columns.get(type_key)
+            if columns is None:
+                unit_def = unit_defs.get(unit.unit_id)
+                flags = (
+                    can_conquer_territory_as_attacker(unit_def),
+                    is_aerial_unit(unit_def),
+                    is_siegework_archetype(unit_def),
+                )
+                if not unit_def:
+                    columns = (unit_def, flags, None, 0, False)
                 else:
-                    other_hits += 1
-            roll_idx += 1
+                    dice_n = unit_def.dice
+                    if not isinstance(dice_n, int) or dice_n < 1:
+                        dice_n = 1
+                    stat_for_casualty_order = (stat_of(unit_def) + type_key[1]) * dice_n
+                    if use_stat_before_cost:
+                        rank = (stat_for_casualty_order, unit_def.total_cost)
+                    else:
+                        rank = (unit_def.total_cost, stat_for_casualty_order)
+                    specials_list = unit_def.specials or []
+                    num_specials = len(specials_list) if isinstance(
+                        specials_list, list) else 0
+                    is_cargo_ranked = is_naval_combat and _is_naval_unit(unit_def)
+                    columns = (unit_def, flags, rank, num_specials, is_cargo_ranked)
+                type_columns[type_key] = columns
+            unit_def, (can_conquer, is_aerial, is_siegework), rank, num_specials, is_cargo_ranked = columns
+            batch.instance_ids.append(unit.instance_id)
+            batch.remaining_health.append(unit.remaining_health)
+            batch.can_conquer.append(can_conquer)
+            batch.is_aerial.append(is_aerial)
+            batch.is_siegework.append(is_siegework)
+            if not unit_def:
+                lead_keys.append(0)
+                health_ranked.append(False)
+                static_keys.append(
+                    (0, 0, (0, 0, ()), 0, unit.remaining_movement, iid))
+                continue
+            cargo_key = _cargo_sort_key(unit) if is_cargo_ranked else (0, 0, ())
+            lead_keys.append(stronghold_sort)
+            health_ranked.append(True)
+            static_keys.append(
+                rank + (cargo_key, num_specials, unit.remaining_movement, iid))
+
+        # Pack (lead, hp_key, static_key) into one int: lead_slot * hp_span * n + (hp_key + hp_offset) * n + static_rank.
+        # static_rank is the dense rank of static_key (equal keys share a rank), so int order == tuple order.
+        # hp_key is -remaining_health (or -1 without a definition); health only drops while hits are applied,
+        # so hp_key stays within [-max starting health, max(0, -lowest health)], where lowest health allows
+        # for every hit landing on a unit that started at 0 HP or below.
+        n = len(static_keys)
+        if not n:
+            return batch
+        static_rank = [0] * n
+        order = sorted(range(n), key=static_keys.__getitem__)
+        rank_value = 0
+        for pos, i in enumerate(order):
+            if pos and static_keys[i] != static_keys[order[pos - 1]]:
+                rank_value += 1
+            static_rank[i] = rank_value
+        hp_offset = max(1, max(batch.remaining_health))
+        lowest_health = min(batch.remaining_health)
+        if lowest_health <= 0:
+            lowest_health -= hits
+        hp_span = hp_offset + max(0, -lowest_health) + 1
+        for i in range(n):
+            lead_slot = lead_keys[i] + 1  # stronghold_sort is -1, 0 or 1
+            base = (lead_slot * hp_span + hp_offset) * n + static_rank[i]
+            if health_ranked[i]:
+                batch.priority_base.append(base)
+                batch.health_weight.append(n)
+            else:
+                batch.priority_base.append(base - n)
+                batch.health_weight.append(0)
+        return batch
+
+    def priority(self, i: int) -> int:
+        """Casualty priority of unit i (lower takes the next hit)."""
+        return self.priority_base[i] - self.remaining_health[i] * self.health_weight[i]
 
-    assert ladder_hits + other_hits <= roll_idx <= len(rolls)
-    return ladder_hits, other_hits
+    def write_back(self) -> None:
+        """Copy the health column back onto the Unit objects."""
+        for unit, hp in zip(self.units, self.remaining_health):
+            unit.remaining_health = hp
 
 
 def _apply_hits(
@@ -789,116 +1011,123 @@ def _apply_hits(
 
     Note: Modifies units list in place (removes dead units).
     """
-    stat_name = "attack" if is_attacker else "defense"
-    mods = stat_modifiers or {}
     destroyed_ids = []
-    wounded_ids = set()
     remaining_hits = hits
-    use_stat_before_cost = casualty_order in ("best_attack", "best_defense")
     # Defender in stronghold: normal hits → stronghold first (-1); ladder hits → non-stronghold first (1 so stronghold last)
     stronghold_sort = 0
     if not is_attacker and territory_is_stronghold:
         stronghold_sort = 1 if hits_from_ladder else -1
 
-    def _cargo_sort_key(boat_unit: Unit, all_units: list[Unit]) -> tuple[int, int, tuple[int, ...]]:
-        """Naval: (cargo_value_sum, num_passengers, tuple(sorted passenger costs)). Asc = sink low-value first."""
-        boat_id = boat_unit.instance_id or ""
-        costs: list[int] = []
-        for u in all_units:
-            if getattr(u, "loaded_onto", None) != boat_id:
-                continue
-            ud = unit_defs.get(u.unit_id)
-            if not ud:
-                continue
-            cost_dict = getattr(ud, "cost", None) or {}
-            c = sum(cost_dict.values()) if isinstance(cost_dict, dict) else 0
-            costs.append(c)
-        costs.sort()
-        return (sum(costs), len(costs), tuple(costs))
-
-    def sort_key(unit: Unit):
-        """Order: stronghold key, remaining_health desc, cost/stat per config, cargo (naval), num_specials, mov, instance_id."""
-        unit_def = unit_defs.get(unit.unit_id)
-        if not unit_def:
-            return (0, -1, 0, 0, (0, 0, ()), 0, unit.remaining_movement, unit.instance_id or '')
-        cost_dict = getattr(unit_def, 'cost', None) or {}
-        total_cost = sum(cost_dict.values()) if isinstance(
-            cost_dict, dict) else 0
-        base_stat = getattr(unit_def, stat_name, 0)
-        effective_stat = base_stat + mods.get(unit.instance_id or '', 0)
-        dice_n = getattr(unit_def, "dice", 1)
-        if not isinstance(dice_n, int) or dice_n < 1:
-            dice_n = 1
-        stat_for_casualty_order = effective_stat * dice_n
-        specials_list = getattr(unit_def, 'specials', None) or []
-        num_specials = len(specials_list) if isinstance(
-            specials_list, list) else 0
-        cargo_key = _cargo_sort_key(unit, units) if (
-            is_naval_combat and _is_naval_unit(unit_def)) else (0, 0, ())
-        if use_stat_before_cost:
-            cost_stat = (-unit.remaining_health, stat_for_casualty_order, total_cost, cargo_key,
-                         num_specials, unit.remaining_movement, unit.instance_id or '')
-        else:
-            cost_stat = (-unit.remaining_health, total_cost, stat_for_casualty_order, cargo_key,
-                         num_specials, unit.remaining_movement, unit.instance_id or '')
-        return (stronghold_sort,) + cost_stat
-
     # Naval combat: only naval and aerial units can take hits (passengers are not targets)
     if is_naval_combat:
         eligible = [u for u in units if _is_naval_unit(unit_defs.get(
             u.unit_id)) or is_aerial_unit(unit_defs.get(u.unit_id))]
     else:
         eligible = units
+    if remaining_hits <= 0 or not eligible:
+        return destroyed_ids, []
 
-    # Apply one hit at a time, re-sorting eligible after each to account for HP changes
-    while remaining_hits > 0 and eligible:
-        eligible.sort(key=sort_key)
-        target = eligible[0]
+    batch = UnitBatch.from_units(
+        eligible, unit_defs, is_attacker,
+        stat_modifiers=stat_modifiers,
+        casualty_order=casualty_order,
+        is_naval_combat=is_naval_combat,
+        stronghold_sort=stronghold_sort,
+        all_units=units,
+        hits=remaining_hits,
+    )
+    health = batch.remaining_health
+    priority = batch.priority
+    n = len(batch.units)
+
+    # Fast path: every unit has 1 HP and no must_conquer redirect, so no priority changes between hits and
+    # the casualties are simply the first `hits` units in priority order (one sort instead of a hit loop).
+    if not (must_conquer and is_attacker) and all(hp == 1 for hp in health):
+        order = sorted(range(n), key=priority)
+        killed = order[:remaining_hits]
+        for i in killed:
+            health[i] = 0
+        destroyed_ids = [batch.instance_ids[i] for i in killed]
+        batch.write_back()
+        if not is_naval_combat:
+            units[:] = [batch.units[i] for i in order[remaining_hits:]]
+        else:
+            destroyed_set = set(destroyed_ids)
+            units[:] = [u for u in units if u.instance_id not in destroyed_set]
+        return destroyed_ids, []
+
+    starting_health = list(health)
+    # A unit is destroyed only when a hit brings it to exactly 0; units already at 0 HP or below stay
+    # targetable (their priority sorts them after healthy units) and just drop further.
+    destroyed = [False] * n
+    alive_count = n
+    last_target = None
+    # Min-heap of (priority, index). Only the hit unit's priority changes, so it is re-pushed after each hit;
+    # entries whose priority no longer matches (or whose unit died) are stale and skipped on pop.
+    heap = [(priority(i), i) for i in range(n)]
+    heapq.heapify(heap)
+
+    # Apply one hit at a time, re-evaluating priority after each to account for HP changes
+    while remaining_hits > 0 and alive_count:
+        while destroyed[heap[0][1]] or heap[0][0] != priority(heap[0][1]):
+            heapq.heappop(heap)
+        target = heap[0][1]
 
         # must_conquer (attacker only): protect the last unit that can conquer (infantry/cavalry…);
         # redirect hit to aerial first, else to siegework (same idea as aerial sacrifice).
-        if must_conquer and is_attacker:
-            conquering = [
-                u for u in eligible
-                if can_conquer_territory_as_attacker(unit_defs.get(u.unit_id))
-            ]
-            aerials = [u for u in eligible if is_aerial_unit(unit_defs.get(u.unit_id))]
-            sw = [u for u in eligible if is_siegework_archetype(unit_defs.get(u.unit_id))]
-            if (
-                target in conquering
-                and len(conquering) == 1
-                and target.remaining_health <= 1
-            ):
+        if must_conquer and is_attacker and batch.can_conquer[target] and health[target] <= 1:
+            alive = [i for i in range(n) if not destroyed[i]]
+            conquering = [i for i in alive if batch.can_conquer[i]]
+            if len(conquering) == 1:
+                aerials = [i for i in alive if batch.is_aerial[i]]
+                sw = [i for i in alive if batch.is_siegework[i]]
                 if aerials:
-                    target = min(aerials, key=sort_key)
+                    target = min(aerials, key=priority)
                 elif sw:
-                    target = min(sw, key=sort_key)
+                    target = min(sw, key=priority)
 
         # Apply one hit
-        target.remaining_health -= 1
+        last_target = target
+        health[target] -= 1
         remaining_hits -= 1
 
         # Check if unit is destroyed
-        if target.remaining_health == 0:
-            destroyed_ids.append(target.instance_id)
-            wounded_ids.discard(target.instance_id)
-            units.remove(target)
-            if is_naval_combat and target in eligible:
-                eligible.remove(target)
+        if health[target] == 0:
+            destroyed_ids.append(batch.instance_ids[target])
+            destroyed[target] = True
+            alive_count -= 1
         else:
-            wounded_ids.add(target.instance_id)
-
-    return destroyed_ids, list(wounded_ids)
+            heapq.heappush(heap, (priority(target), target))
+
+    # Survivors are every unit not destroyed by this call; units already at <= 0 HP stay, as they did
+    # before the batch rewrite.
+    alive = [i for i in range(n) if not destroyed[i]]
+    # Wounded = survivors that lost health this call (no per-hit set bookkeeping)
+    wounded_ids = [
+        batch.instance_ids[i] for i in alive if health[i] < starting_health[i]]
+    batch.write_back()
+    if not is_naval_combat and last_target is not None:
+        # units is the eligible list and callers see its order: survivors stay in the order the per-hit
+        # re-sort left them, i.e. priority as of the last hit, with the last target ranked at its health
+        # before that hit (one more HP lowers priority by its health weight).
+        last_target_priority = priority(last_target) - batch.health_weight[last_target]
+
+        def order_before_last_hit(i: int) -> int:
+            return last_target_priority if i == last_target else priority(i)
+
+        units[:] = [batch.units[i] for i in sorted(alive, key=order_before_last_hit)]
+    elif destroyed_ids:
+        destroyed_set = set(destroyed_ids)
+        units[:] = [u for u in units if u.instance_id not in destroyed_set]
+    return destroyed_ids, wounded_ids
 
 
 def calculate_required_dice(units: list[Unit], unit_defs: dict[str, UnitDefinition]) -> int:
-    """Calculate how many dice rolls are needed for a list of units."""
-    total = 0
-    for unit in units:
-        unit_def = unit_defs.get(unit.unit_id)
-        dice_count = getattr(unit_def, 'dice', 1) if unit_def else 1
-        total += dice_count
-    return total
+    """Calculate how many dice rolls are needed for a list of units (1 per unit without a definition)."""
+    return sum(
+        unit_def.dice if (unit_def := unit_defs.get(unit.unit_id)) else 1
+        for unit in units
+    )
 
 
 def sort_attackers_for_ladder_dice_order(
@@ -1023,40 +1252,26 @@ def group_dice_by_stat(
 
     Returns dict of {stat_value: {"rolls": [rolls], "hits": count}}
     """
-    stat_name = "attack" if is_attacker else "defense"
-    mods = stat_modifiers or {}
-    stat_override = effective_stat_override or {}
-    skip_arch = exclude_archetypes_from_rolling or set()
-
-    result: dict[int, dict] = {}
-    roll_idx = 0
-    for unit in units:
-        unit_def = unit_defs.get(unit.unit_id)
-        if not unit_def:
-            continue
-        if getattr(unit_def, "archetype", "") in skip_arch:
+    rolling = _rolling_unit_stats(
+        units, unit_defs, is_attacker,
+        stat_modifiers=stat_modifiers,
+        effective_dice_override=effective_dice_override,
+        effective_stat_override=effective_stat_override,
+        exclude_archetypes=exclude_archetypes_from_rolling,
+    )
+    # Gather each stat's rolls first, then count hits once per stat rather than once per unit.
+    rolls_by_stat: dict[int, list[int]] = {}
+    offset = 0  # start of this unit's rolls (cumulative dice of earlier units)
+    for _, _, stat_value, dice_count in rolling:
+        stat_rolls = rolls_by_stat.setdefault(stat_value, [])
+        if dice_count <= 0:
             continue
-        if unit.instance_id in stat_override:
-            stat_value = stat_override[unit.instance_id]
-        else:
-            stat_value = getattr(unit_def, stat_name, 0) + \
-                mods.get(unit.instance_id, 0)
-        dice_count = (
-            effective_dice_override.get(
-                unit.instance_id, getattr(unit_def, "dice", 1))
-            if effective_dice_override is not None
-            else getattr(unit_def, "dice", 1)
-        )
-        if stat_value not in result:
-            result[stat_value] = {"rolls": [], "hits": 0}
-        for _ in range(dice_count):
-            if roll_idx < len(rolls):
-                roll = rolls[roll_idx]
-                result[stat_value]["rolls"].append(roll)
-                if roll <= stat_value:
-                    result[stat_value]["hits"] += 1
-            roll_idx += 1
-    return result
+        stat_rolls.extend(rolls[offset:offset + dice_count])
+        offset += dice_count
+    return {
+        stat_value: {"rolls": stat_rolls, "hits": sum(map(le, stat_rolls, repeat(stat_value)))}
+        for stat_value, stat_rolls in rolls_by_stat.items()
+    }
 
 
 def group_siegework_attacker_dice_ram_and_flex(
@@ -1072,7 +1287,6 @@ def group_siegework_attacker_dice_ram_and_flex(
     Split each attack stat into ram (stronghold-only) vs flexible siegework dice for UI.
     Every stat key includes both \"ram\" and \"flex\" buckets (possibly empty rolls).
     """
-    stat_name = "attack"
     mods = stat_modifiers or {}
     stat_override = effective_stat_override or {}
     result: dict[int, dict[str, dict]] = {}
@@ -1085,7 +1299,7 @@ def group_siegework_attacker_dice_ram_and_flex(
             }
         return result[stat_val]
 
-    roll_idx = 0
+    roll_iter = iter(rolls)  # consumed in unit order; each unit takes its next dice_count rolls
     for unit in units:
         unit_def = unit_defs.get(unit.unit_id)
         if not unit_def:
@@ -1093,24 +1307,20 @@ def group_siegework_attacker_dice_ram_and_flex(
         if unit.instance_id in stat_override:
             stat_value = stat_override[unit.instance_id]
         else:
-            stat_value = getattr(unit_def, stat_name, 0) + \
-                mods.get(unit.instance_id, 0)
+            stat_value = unit_def.attack + mods.get(unit.instance_id, 0)
         dice_count = (
             effective_dice_override.get(
-                unit.instance_id, getattr(unit_def, "dice", 1))
+                unit.instance_id, unit_def.dice)
             if effective_dice_override is not None
-            else getattr(unit_def, "dice", 1)
+            else unit_def.dice
         )
         bucket_key = "ram" if has_unit_special(
             unit_def, SIEGEWORK_SPECIAL_RAM) else "flex"
         bucket = ensure_stat(stat_value)[bucket_key]
-        for _ in range(dice_count):
-            if roll_idx < len(rolls):
-                roll = rolls[roll_idx]
-                bucket["rolls"].append(roll)
-                if roll <= stat_value:
-                    bucket["hits"] += 1
-            roll_idx += 1
+        for roll in islice(roll_iter, dice_count):
+            bucket["rolls"].append(roll)
+            if roll <= stat_value:
+                bucket["hits"] += 1
     return result
 
 
@@ -172,6 +172,7 @@ def run_one_battle(
     territory_defs: dict[str, TerritoryDefinition],
     options: SimOptions | None = None,
     seed: int | None = None,
+    modifier_cache: dict | None = None,
 ) -> BattleOutcome:
     """
     Run a single combat to resolution (or retreat / max_rounds).
@@ -186,6 +187,9 @@ def run_one_battle(
         unit_defs, territory_defs: From load_static_definitions(setup_id=...).
         options: Casualty orders, must_conquer, max_rounds, retreat threshold, etc.
         seed: Optional RNG seed for this battle (reproducibility).
+        modifier_cache: Optional dict shared by battles with the same stacks, territory and options
+            (run_simulation trials). Instance ids are deterministic per stack list, so stat modifiers
+            computed for a roster in one trial are reused by every later trial that reaches it.
 
     Returns:
         BattleOutcome with winner, retreat, conquered, rounds, casualties by unit_id.
@@ -225,6 +229,41 @@ def run_one_battle(
     casualty_order_attacker = opts.casualty_order_attacker
     must_conquer = opts.must_conquer
 
+    # Terrain and sea raider bonuses depend only on each unit's own tags: compute once per battle.
+    # Anti-cavalry and captain bonuses depend on who is still alive, so they are cached per roster.
+    terrain_att_all, terrain_def_all = compute_terrain_stat_modifiers(
+        territory_def, attacker_units, defender_units, unit_defs
+    )
+    sea_raider_att_all, _ = compute_sea_raider_stat_modifiers(
+        attacker_units, unit_defs, is_sea_raid=opts.is_sea_raid
+    )
+    roster_mods_cache: dict[tuple[frozenset, frozenset], tuple[dict[str, int], dict[str, int], dict[str, int]]] = (
+        modifier_cache if modifier_cache is not None else {}
+    )
+
+    def roster_modifiers() -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+        """(attacker_mods, attacker_mods_with_sea_raider, defender_mods) for the current rosters."""
+        att_ids = frozenset(u.instance_id for u in attacker_units)
+        def_ids = frozenset(u.instance_id for u in defender_units)
+        cached = roster_mods_cache.get((att_ids, def_ids))
+        if cached is None:
+            terrain_att = {iid: v for iid, v in terrain_att_all.items() if iid in att_ids}
+            terrain_def = {iid: v for iid, v in terrain_def_all.items() if iid in def_ids}
+            sea_raider_att = {iid: v for iid, v in sea_raider_att_all.items() if iid in att_ids}
+            anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
+                attacker_units, defender_units, unit_defs
+            )
+            captain_att, captain_def = compute_captain_stat_modifiers(
+                attacker_units, defender_units, unit_defs
+            )
+            cached = (
+                merge_stat_modifiers(terrain_att, anticav_att, captain_att),
+                merge_stat_modifiers(terrain_att, anticav_att, captain_att, sea_raider_att),
+                merge_stat_modifiers(terrain_def, anticav_def, captain_def),
+            )
+            roster_mods_cache[(att_ids, def_ids)] = cached
+        return cached
+
     round_number = 0
     ran_stealth_prefire = False
 
@@ -235,21 +274,7 @@ def run_one_battle(
     ):
         ran_stealth_prefire = True
         dice = generate_combat_rolls_for_units(attacker_units, defender_units, unit_defs, seed=None)
-        terrain_att, terrain_def = compute_terrain_stat_modifiers(
-            territory_def, attacker_units, defender_units, unit_defs
-        )
-        anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-            attacker_units, defender_units, unit_defs
-        )
-        captain_att, captain_def = compute_captain_stat_modifiers(
-            attacker_units, defender_units, unit_defs
-        )
-        sea_raider_att, _ = compute_sea_raider_stat_modifiers(
-            attacker_units, unit_defs, is_sea_raid=opts.is_sea_raid
-        )
-        attacker_mods = merge_stat_modifiers(
-            terrain_att, anticav_att, captain_att, sea_raider_att
-        )
+        _, attacker_mods, _ = roster_modifiers()
         prefire_result = resolve_stealth_prefire(
             attacker_units,
             defender_units,
@@ -307,17 +332,7 @@ def run_one_battle(
         # --- Siegeworks round: before archer prefire and round 1 (stronghold soaks ram/bomb etc.; overflow hits defenders). ---
         if attacker_units and defender_units and siegework_applies:
             siegeworks_occurred = True
-            terrain_att, terrain_def = compute_terrain_stat_modifiers(
-                territory_def, attacker_units, defender_units, unit_defs
-            )
-            anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            captain_att, captain_def = compute_captain_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            attacker_mods = merge_stat_modifiers(terrain_att, anticav_att, captain_att)
-            defender_mods = merge_stat_modifiers(terrain_def, anticav_def, captain_def)
+            attacker_mods, _, defender_mods = roster_modifiers()
             att_rolling = get_siegework_attacker_rolling_units(
                 attacker_units, unit_defs, defender_territory_is_stronghold,
                 defender_stronghold_hp=stronghold_hp,
@@ -430,16 +445,7 @@ def run_one_battle(
         defender_archer_units = [u for u in defender_units if archer_prefire_eligible(unit_defs.get(u.unit_id))]
         if attacker_units and defender_archer_units:
             dice = generate_combat_rolls_for_units(attacker_units, defender_units, unit_defs, seed=None)
-            terrain_att, terrain_def = compute_terrain_stat_modifiers(
-                territory_def, attacker_units, defender_units, unit_defs
-            )
-            anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            captain_att, captain_def = compute_captain_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            defender_mods = merge_stat_modifiers(terrain_def, anticav_def, captain_def)
+            _, _, defender_mods = roster_modifiers()
             prefire_result = resolve_archer_prefire(
                 attacker_units,
                 defender_archer_units,
@@ -481,6 +487,8 @@ def run_one_battle(
     )
 
     # --- Round loop ---
+    # Each round's result is consumed before the next, so one RoundResult is refilled per battle
+    round_result: RoundResult | None = None
     while True:
         round_number += 1
 
@@ -538,21 +546,7 @@ def run_one_battle(
         )
         ladder_set = set(ladder_infantry_instance_ids)
         if ladder_set:
-            terrain_att, terrain_def = compute_terrain_stat_modifiers(
-                territory_def, attacker_units, defender_units, unit_defs
-            )
-            anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            captain_att, captain_def = compute_captain_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            sea_raider_att, _ = compute_sea_raider_stat_modifiers(
-                attacker_units, unit_defs, is_sea_raid=opts.is_sea_raid
-            )
-            am = merge_stat_modifiers(
-                terrain_att, anticav_att, captain_att, sea_raider_att
-            )
+            _, am, _ = roster_modifiers()
             sort_attackers_for_ladder_dice_order(
                 attacker_units, unit_defs, ladder_set, am, att_attack_override or None,
             )
@@ -564,16 +558,7 @@ def run_one_battle(
 
         # Round 1 terror: hope cancels terror then cap at 3 defender hit dice re-rolled
         if round_number == 1:
-            terrain_att, terrain_def = compute_terrain_stat_modifiers(
-                territory_def, attacker_units, defender_units, unit_defs
-            )
-            anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            captain_att, captain_def = compute_captain_stat_modifiers(
-                attacker_units, defender_units, unit_defs
-            )
-            defender_mods_r1 = merge_stat_modifiers(terrain_def, anticav_def, captain_def)
+            _, _, defender_mods_r1 = roster_modifiers()
             terror_indices, _ = get_terror_reroll_targets(
                 attacker_units,
                 defender_units,
@@ -590,22 +575,7 @@ def run_one_battle(
                         defender_rolls[idx] = random.randint(1, DICE_SIDES)
                 dice_rolls = {**dice_rolls, "defender": defender_rolls}
 
-        terrain_att, terrain_def = compute_terrain_stat_modifiers(
-            territory_def, attacker_units, defender_units, unit_defs
-        )
-        anticav_att, anticav_def = compute_anti_cavalry_stat_modifiers(
-            attacker_units, defender_units, unit_defs
-        )
-        captain_att, captain_def = compute_captain_stat_modifiers(
-            attacker_units, defender_units, unit_defs
-        )
-        sea_raider_att, _ = compute_sea_raider_stat_modifiers(
-            attacker_units, unit_defs, is_sea_raid=opts.is_sea_raid
-        )
-        attacker_mods = merge_stat_modifiers(
-            terrain_att, anticav_att, captain_att, sea_raider_att
-        )
-        defender_mods = merge_stat_modifiers(terrain_def, anticav_def, captain_def)
+        _, attacker_mods, defender_mods = roster_modifiers()
 
         defender_territory_is_stronghold = bool(territory_def and getattr(territory_def, "is_stronghold", False))
         round_result, stronghold_hp = resolve_combat_round(
@@ -627,6 +597,7 @@ def run_one_battle(
             defender_territory_is_stronghold=defender_territory_is_stronghold,
             exclude_archetypes_from_rolling=["siegework"],
             attacker_ladder_instance_ids=set(ladder_infantry_instance_ids),
+            out=round_result,
         )
 
         for iid in round_result.attacker_casualties:
@@ -637,15 +608,7 @@ def run_one_battle(
             uid = instance_to_def_uid.get(iid)
             if uid:
                 all_def_casualties[uid] += 1
-
-        attacker_units[:] = [
-            u for u in attacker_units
-            if u.instance_id in round_result.surviving_attacker_ids
-        ]
-        defender_units[:] = [
-            u for u in defender_units
-            if u.instance_id in round_result.surviving_defender_ids
-        ]
+        # resolve_combat_round already pruned attacker_units / defender_units in place to the survivors.
 
         if round_result.attackers_eliminated:
             return BattleOutcome(
@@ -868,6 +831,8 @@ def run_simulation(
                 total += count * cost.get("power", 0)
         return total
 
+    # Roster -> stat modifiers, shared across trials (same stacks/territory/options every trial)
+    modifier_cache: dict = {}
     for i in range(n_trials):
         trial_seed = (seed + i) if seed is not None else None
         outcome = run_one_battle(
@@ -878,6 +843,7 @@ def run_simulation(
             territory_defs,
             options=opts,
             seed=trial_seed,
+            modifier_cache=modifier_cache,
         )
         if outcome.winner == "attacker":
             attacker_wins += 1
@@ -5,9 +5,55 @@ camps.json, starting_setup.json, and optional manifest.json (display_name, map_a
 """
 
 import json
-from dataclasses import dataclass, field
+import os
+import sys
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json parses the same files
+    orjson = None
+
+
+def _read_json(path: Path | str) -> Any:
+    """
+    Parse a JSON file, with orjson when installed. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers keep catching the stdlib exception either way.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# path -> ((st_mtime_ns, st_size), parsed JSON). Process-wide: a file is re-parsed only when it changes on disk.
+_json_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    _read_json, reusing the previous parse while the file's mtime/size are unchanged.
+    The returned data is shared between calls: read from it, never mutate it. Used for
+    definitions, manifests and specials; starting_setup is read fresh since callers build
+    game state from it.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = _read_json(path)
+    _json_cache[path] = (stamp, data)
+    return data
+
+
+def clear_setup_cache() -> None:
+    """Drop all cached setup JSON (tests that rewrite setup files within one mtime tick)."""
+    _json_cache.clear()
 
 
 def parse_prefire_penalty_from_manifest(raw: Any) -> bool:
@@ -60,8 +106,7 @@ def read_setup_manifest(setup_id: str) -> dict[str, Any] | None:
     if not manifest_path.is_file():
         return None
     try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json_cached(manifest_path)
         return data if isinstance(data, dict) else None
     except (json.JSONDecodeError, OSError):
         return None
@@ -92,36 +137,37 @@ def list_setups() -> list[dict]:
 
     Requires manifest `is_active` to be exactly true (no default). Also requires non-empty context.
     """
-    out = []
-    if not SETUPS_DIR.exists():
-        return out
-    for d in sorted(SETUPS_DIR.iterdir()):
-        if not d.is_dir():
-            continue
-        setup_id = d.name
-        if not (d / "starting_setup.json").exists():
-            continue
-        manifest_path = d / "manifest.json"
-        if not manifest_path.exists():
-            continue
-        try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                m = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            continue
-        if m.get("is_active") is not True:
-            continue
-        ctx = m.get("context")
-        if not isinstance(ctx, dict) or not ctx:
-            continue
-        entry = {
-            "id": m.get("id", setup_id),
-            "display_name": m.get("display_name", setup_id),
-            "map_asset": m.get("map_asset", setup_id),
-            "context": ctx,
-        }
-        out.append(entry)
-    return out
+    found: list[tuple[str, dict]] = []
+    # One unsorted scandir pass (DirEntry.is_dir needs no extra stat); only accepted setups are kept
+    # and sorted at the end. A missing manifest surfaces as FileNotFoundError from the cached read.
+    try:
+        with os.scandir(SETUPS_DIR) as it:
+            for dir_entry in it:
+                if not dir_entry.is_dir():
+                    continue
+                setup_id = dir_entry.name
+                if not os.path.exists(os.path.join(dir_entry.path, "starting_setup.json")):
+                    continue
+                try:
+                    m = _read_json_cached(Path(dir_entry.path) / "manifest.json")
+                except (json.JSONDecodeError, OSError):
+                    continue
+                if m.get("is_active") is not True:
+                    continue
+                ctx = m.get("context")
+                if not isinstance(ctx, dict) or not ctx:
+                    continue
+                entry = {
+                    "id": m.get("id", setup_id),
+                    "display_name": m.get("display_name", setup_id),
+                    "map_asset": m.get("map_asset", setup_id),
+                    "context": ctx,
+                }
+                found.append((setup_id, entry))
+    except FileNotFoundError:
+        return []
+    found.sort(key=lambda pair: pair[0])  # directory name order, as before
+    return [entry for _, entry in found]
 
 
 def load_setup(setup_id: str) -> dict:
@@ -135,13 +181,11 @@ def load_setup(setup_id: str) -> dict:
     starting_path = setup_dir / "starting_setup.json"
     if not starting_path.exists():
         raise FileNotFoundError(f"starting_setup.json not found in setup: {setup_id}")
-    with open(starting_path, "r") as f:
-        starting_setup = json.load(f)
+    starting_setup = _read_json(starting_path)
     manifest_path = setup_dir / "manifest.json"
     if manifest_path.exists():
         try:
-            with open(manifest_path, "r") as f:
-                m = json.load(f)
+            m = _read_json_cached(manifest_path)
             result = {
                 "id": m.get("id", setup_id),
                 "display_name": m.get("display_name", setup_id),
@@ -171,9 +215,9 @@ def load_setup(setup_id: str) -> dict:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitDefinition:
-    """Defines immutable properties of a unit type."""
+    """Defines immutable properties of a unit type. Slotted: read in every combat/movement hot loop."""
     id: str
     display_name: str
     faction: str
@@ -195,9 +239,14 @@ class UnitDefinition:
     specials: list[str] = field(default_factory=list)
     home_territory_id: Optional[str] = None  # Deprecated: use home_territory_ids only
     home_territory_ids: Optional[list[str]] = None  # Home territories: can deploy 1 per territory per mobilization
+    # Derived: sum of cost values (combat casualty/captain ordering reads this instead of re-summing cost)
+    total_cost: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.total_cost = sum(self.cost.values()) if isinstance(self.cost, dict) else 0
 
-@dataclass
+
+@dataclass(slots=True)
 class TerritoryDefinition:
     """Defines immutable properties of a territory."""
     id: str
@@ -216,15 +265,14 @@ class TerritoryDefinition:
     ford_adjacent: list[str] = field(default_factory=list)
 
 
-@dataclass
-class CampDefinition:
-    """Defines a camp (mobilization point) in a territory. Destroyed when the territory is captured or liberated."""
+class CampDefinition(NamedTuple):
+    """Defines a camp (mobilization point) in a territory. Destroyed when the territory is captured or liberated.
+    A NamedTuple: two immutable ids, so a plain tuple with field names is all it needs."""
     id: str
     territory_id: str  # Which territory this camp is in
 
 
-@dataclass
-class PortDefinition:
+class PortDefinition(NamedTuple):
     """Defines a port (naval mobilization point) in a territory. Immutable, not destroyed on conquest."""
     id: str
     territory_id: str  # Which territory this port is in
@@ -253,7 +301,7 @@ def _coerce_faction_music(raw: Any) -> str | list[str] | None:
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class FactionDefinition:
     """Defines immutable properties of a faction."""
     id: str
@@ -273,16 +321,203 @@ def is_transportable(ud: "UnitDefinition | None") -> bool:
     return "transportable" in (getattr(ud, "tags", None) or [])
 
 
-def _parse_home_territories(data: dict) -> dict:
+def _parse_home_territories(data: dict) -> list[str] | None:
     """Return home_territory_ids from unit data (list only; supports legacy home_territory_id single key)."""
     ids = data.get("home_territory_ids")
-    single = data.get("home_territory_id")
     if isinstance(ids, list):
         ids = [x for x in ids if isinstance(x, str)]
-        return {"home_territory_ids": ids if ids else None}
+        return ids if ids else None
+    single = data.get("home_territory_id")
     if single is not None and isinstance(single, str):
-        return {"home_territory_ids": [single]}
-    return {"home_territory_ids": None}
+        return [single]
+    return None
+
+
+def _build_unit(data: dict) -> UnitDefinition:
+    # Runs for every unit on every setup/snapshot load: keep per-unit work to dict reads.
+    # Positional args in UnitDefinition field order (skips building a kwargs mapping per unit).
+    return UnitDefinition(
+        data["id"],
+        data["display_name"],
+        data["faction"],
+        data["archetype"],
+        list(data.get("tags", [])),
+        data["attack"],
+        data["defense"],
+        data["movement"],
+        data["health"],
+        data["cost"],
+        data.get("dice", 1),
+        data.get("purchasable", True),
+        data.get("unique", False),
+        data.get("icon"),
+        data.get("transport_capacity", 0),
+        data.get("downgrade_to"),
+        data.get("specials", []),
+        None,  # home_territory_id (deprecated)
+        _parse_home_territories(data),
+    )
+
+
+def _stronghold_base_health(data: dict) -> int:
+    """stronghold_base_health, falling back to the legacy stronghold_health key; 0 if neither."""
+    if data.get("stronghold_base_health") is not None:
+        return int(data["stronghold_base_health"])
+    if data.get("stronghold_health") is not None:
+        return int(data["stronghold_health"])
+    return 0
+
+
+def _build_territory(data: dict) -> TerritoryDefinition:
+    # Positional args in TerritoryDefinition field order
+    return TerritoryDefinition(
+        data["id"],
+        data["display_name"],
+        data["terrain_type"],
+        data["adjacent"],
+        data["produces"],
+        data.get("is_stronghold", False),
+        _stronghold_base_health(data),
+        data.get("ownable", True),
+        data.get("aerial_adjacent", []),
+        data.get("ford_adjacent", []),
+    )
+
+
+def _build_faction(data: dict) -> FactionDefinition:
+    # Positional args in FactionDefinition field order
+    return FactionDefinition(
+        data["id"],
+        data["display_name"],
+        data["alliance"],
+        _faction_capital_from_json(data.get("capital")),
+        data["color"],
+        data.get("icon"),
+        _coerce_faction_music(data.get("music")),
+    )
+
+
+def _build_camp(data: dict) -> CampDefinition:
+    return CampDefinition(data["id"], data["territory_id"])
+
+
+def _build_port(data: dict) -> PortDefinition:
+    return PortDefinition(data["id"], data["territory_id"])
+
+
+# Per-kind map builders: the one construction path for setup files (SetupDefinitions) and
+# game config snapshots (definitions_from_snapshot).
+
+def _build_units(units_data: dict[str, dict]) -> dict[str, UnitDefinition]:
+    # Keys interned to match Unit.unit_id (also interned) by identity on every unit_defs lookup
+    return {sys.intern(unit_id): _build_unit(data) for unit_id, data in units_data.items()}
+
+
+def _build_territories(territories_data: dict[str, dict]) -> dict[str, TerritoryDefinition]:
+    return {territory_id: _build_territory(data) for territory_id, data in territories_data.items()}
+
+
+def _build_factions(factions_data: dict[str, dict]) -> dict[str, FactionDefinition]:
+    return {faction_id: _build_faction(data) for faction_id, data in factions_data.items()}
+
+
+def _build_camps(camps_data: dict[str, dict]) -> dict[str, CampDefinition]:
+    return {camp_id: _build_camp(data) for camp_id, data in camps_data.items()}
+
+
+def _build_ports(ports_data: dict[str, dict]) -> dict[str, PortDefinition]:
+    return {port_id: _build_port(data) for port_id, data in ports_data.items()}
+
+
+# definition class -> serialized field names, in declaration order (asdict() order, minus derived fields)
+_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def definitions_to_dicts(defs: dict[str, Any] | None) -> dict[str, dict]:
+    """
+    JSON-ready {id: field dict} for a definitions map (game config snapshots, /definitions).
+    Same output as {k: asdict(v)} (v._asdict() for the NamedTuple kinds) without derived
+    init=False fields such as UnitDefinition.total_cost, so snapshots keep the constructor schema.
+    Definition fields hold only scalars and flat lists/dicts, so a one-level copy of each container
+    replaces asdict's recursive deepcopy walk.
+    """
+    out = {}
+    for def_id, defn in (defs or {}).items():
+        cls = type(defn)
+        names = _field_names.get(cls)
+        if names is None:
+            # NamedTuple definitions (camps, ports) list their fields in _fields
+            names = getattr(cls, "_fields", None) or tuple(f.name for f in fields(cls) if f.init)
+            _field_names[cls] = names
+        row = {}
+        for name in names:
+            value = getattr(defn, name)
+            if type(value) is list:
+                value = list(value)
+            elif type(value) is dict:
+                value = dict(value)
+            row[name] = value
+        out[def_id] = row
+    return out
+
+
+class SetupDefinitions:
+    """
+    Static definitions of one setup directory, each kind parsed and built on first access.
+    Callers that need only some kinds (e.g. combat simulation: units + territories) skip
+    reading the other files. load_static_definitions() forces all of them.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+
+    def _optional_json(self, name: str) -> dict:
+        path = self.data_dir / name
+        return _read_json_cached(path) if path.exists() else {}
+
+    @cached_property
+    def units(self) -> dict[str, UnitDefinition]:
+        return _build_units(_read_json_cached(self.data_dir / "units.json"))
+
+    @cached_property
+    def territories(self) -> dict[str, TerritoryDefinition]:
+        return _build_territories(_read_json_cached(self.data_dir / "territories.json"))
+
+    @cached_property
+    def factions(self) -> dict[str, FactionDefinition]:
+        return _build_factions(_read_json_cached(self.data_dir / "factions.json"))
+
+    @cached_property
+    def camps(self) -> dict[str, CampDefinition]:
+        # Camps (mobilization points; each has a territory, destroyed when territory is captured)
+        return _build_camps(self._optional_json("camps.json"))
+
+    @cached_property
+    def ports(self) -> dict[str, PortDefinition]:
+        # Ports (naval mobilization points; immutable, not destroyed on conquest)
+        return _build_ports(self._optional_json("ports.json"))
+
+    def as_tuple(self) -> tuple[
+        dict[str, UnitDefinition],
+        dict[str, TerritoryDefinition],
+        dict[str, FactionDefinition],
+        dict[str, CampDefinition],
+        dict[str, PortDefinition],
+    ]:
+        """(units, territories, factions, camps, ports), the load_static_definitions shape."""
+        return self.units, self.territories, self.factions, self.camps, self.ports
+
+
+def load_static_definitions_lazy(
+    data_dir: Path | str | None = None,
+    setup_id: str | None = None,
+) -> SetupDefinitions:
+    """Like load_static_definitions, but each definition kind is only loaded when first accessed."""
+    if data_dir is not None:
+        return SetupDefinitions(Path(data_dir))
+    if setup_id is not None:
+        return SetupDefinitions(_setup_dir(setup_id))
+    raise ValueError("Either data_dir or setup_id must be provided")
 
 
 def load_static_definitions(
@@ -304,99 +539,7 @@ def load_static_definitions(
 
     Returns: (unit_definitions, territory_definitions, faction_definitions, camp_definitions)
     """
-    if data_dir is not None:
-        data_dir = Path(data_dir)
-    elif setup_id is not None:
-        data_dir = _setup_dir(setup_id)
-    else:
-        raise ValueError("Either data_dir or setup_id must be provided")
-
-    # Load units
-    with open(data_dir / "units.json", "r") as f:
-        units_data = json.load(f)
-
-    units = {}
-    for unit_id, data in units_data.items():
-        tags_list = list(data.get("tags", []))
-        units[unit_id] = UnitDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            faction=data["faction"],
-            archetype=data["archetype"],
-            tags=tags_list,
-            attack=data["attack"],
-            defense=data["defense"],
-            movement=data["movement"],
-            health=data["health"],
-            cost=data["cost"],
-            dice=data.get("dice", 1),
-            purchasable=data.get("purchasable", True),
-            unique=data.get("unique", False),
-            icon=data.get("icon"),
-            transport_capacity=data.get("transport_capacity", 0),
-            downgrade_to=data.get("downgrade_to"),
-            specials=data.get("specials", []),
-            **_parse_home_territories(data),
-        )
-
-    # Load territories
-    with open(data_dir / "territories.json", "r") as f:
-        territories_data = json.load(f)
-
-    territories = {}
-    for territory_id, data in territories_data.items():
-        territories[territory_id] = TerritoryDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            terrain_type=data["terrain_type"],
-            adjacent=data["adjacent"],
-            produces=data["produces"],
-            is_stronghold=data.get("is_stronghold", False),
-            stronghold_base_health=int(data["stronghold_base_health"]) if data.get("stronghold_base_health") is not None else int(data["stronghold_health"]) if data.get("stronghold_health") is not None else 0,
-            ownable=data.get("ownable", True),
-            aerial_adjacent=data.get("aerial_adjacent", []),
-            ford_adjacent=data.get("ford_adjacent", []),
-        )
-
-    # Load factions
-    with open(data_dir / "factions.json", "r") as f:
-        factions_data = json.load(f)
-
-    factions = {}
-    for faction_id, data in factions_data.items():
-        factions[faction_id] = FactionDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            alliance=data["alliance"],
-            capital=_faction_capital_from_json(data.get("capital")),
-            color=data["color"],
-            icon=data.get("icon"),
-            music=_coerce_faction_music(data.get("music")),
-        )
-
-    # Load camps (mobilization points; each has a territory, destroyed when territory is captured)
-    camps = {}
-    camps_path = data_dir / "camps.json"
-    if camps_path.exists():
-        with open(camps_path, "r") as f:
-            camps_data = json.load(f)
-        for camp_id, data in camps_data.items():
-            camps[camp_id] = CampDefinition(
-                id=data["id"],
-                territory_id=data["territory_id"],
-            )
-    # Load ports (naval mobilization points; immutable, not destroyed on conquest)
-    ports = {}
-    ports_path = data_dir / "ports.json"
-    if ports_path.exists():
-        with open(ports_path, "r") as f:
-            ports_data = json.load(f)
-        for port_id, data in ports_data.items():
-            ports[port_id] = PortDefinition(
-                id=data["id"],
-                territory_id=data["territory_id"],
-            )
-    return units, territories, factions, camps, ports
+    return load_static_definitions_lazy(data_dir, setup_id).as_tuple()
 
 
 def definitions_from_snapshot(snapshot: dict) -> tuple[
@@ -411,78 +554,13 @@ def definitions_from_snapshot(snapshot: dict) -> tuple[
     Snapshot must have keys: units, territories, factions, camps, ports (each id -> dict of fields).
     Used so a game always uses the definitions it was created with.
     """
-    units_data = snapshot.get("units") or {}
-    territories_data = snapshot.get("territories") or {}
-    factions_data = snapshot.get("factions") or {}
-    camps_data = snapshot.get("camps") or {}
-    ports_data = snapshot.get("ports") or {}
-
-    units = {}
-    for unit_id, data in units_data.items():
-        tags_list = list(data.get("tags", []))
-        units[unit_id] = UnitDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            faction=data["faction"],
-            archetype=data["archetype"],
-            tags=tags_list,
-            attack=data["attack"],
-            defense=data["defense"],
-            movement=data["movement"],
-            health=data["health"],
-            cost=data["cost"],
-            dice=data.get("dice", 1),
-            purchasable=data.get("purchasable", True),
-            unique=data.get("unique", False),
-            icon=data.get("icon"),
-            transport_capacity=data.get("transport_capacity", 0),
-            downgrade_to=data.get("downgrade_to"),
-            specials=data.get("specials", []),
-            **_parse_home_territories(data),
-        )
-
-    territories = {}
-    for territory_id, data in territories_data.items():
-        territories[territory_id] = TerritoryDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            terrain_type=data["terrain_type"],
-            adjacent=data["adjacent"],
-            produces=data["produces"],
-            is_stronghold=data.get("is_stronghold", False),
-            stronghold_base_health=int(data["stronghold_base_health"]) if data.get("stronghold_base_health") is not None else int(data["stronghold_health"]) if data.get("stronghold_health") is not None else 0,
-            ownable=data.get("ownable", True),
-            aerial_adjacent=data.get("aerial_adjacent", []),
-            ford_adjacent=data.get("ford_adjacent", []),
-        )
-
-    factions = {}
-    for faction_id, data in factions_data.items():
-        factions[faction_id] = FactionDefinition(
-            id=data["id"],
-            display_name=data["display_name"],
-            alliance=data["alliance"],
-            capital=_faction_capital_from_json(data.get("capital")),
-            color=data["color"],
-            icon=data.get("icon"),
-            music=_coerce_faction_music(data.get("music")),
-        )
-
-    camps = {}
-    for camp_id, data in camps_data.items():
-        camps[camp_id] = CampDefinition(
-            id=data["id"],
-            territory_id=data["territory_id"],
-        )
-
-    ports = {}
-    for port_id, data in ports_data.items():
-        ports[port_id] = PortDefinition(
-            id=data["id"],
-            territory_id=data["territory_id"],
-        )
-
-    return units, territories, factions, camps, ports
+    return (
+        _build_units(snapshot.get("units") or {}),
+        _build_territories(snapshot.get("territories") or {}),
+        _build_factions(snapshot.get("factions") or {}),
+        _build_camps(snapshot.get("camps") or {}),
+        _build_ports(snapshot.get("ports") or {}),
+    )
 
 
 def load_specials(
@@ -506,8 +584,7 @@ def load_specials(
     if not path.exists():
         return {}, []
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
+        data = _read_json_cached(path)
     except (json.JSONDecodeError, OSError):
         return {}, []
     if not isinstance(data, dict):
@@ -543,5 +620,4 @@ def load_starting_setup(data_dir: Path | str | None = None, setup_id: str | None
         path = _setup_dir(setup_id) / "starting_setup.json"
     else:
         return load_setup(_default_setup_id())["starting_setup"]
-    with open(path, "r") as f:
-        return json.load(f)
+    return _read_json(path)
@@ -10,9 +10,9 @@ if TYPE_CHECKING:
     from backend.engine.state import GameState
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
-    """Base event class. All events have a type and payload."""
+    """Base event class. All events have a type and payload. Slotted: one is allocated per emitted event."""
     type: str
     payload: dict[str, Any]
 
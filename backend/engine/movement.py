@@ -589,17 +589,21 @@ def _adjacent_ids(
     territory_def: TerritoryDefinition | None,
     is_aerial: bool = False,
 ) -> list[str]:
-    """Neighbors for movement: adjacent + aerial_adjacent when is_aerial (deduped, order preserved)."""
+    """
+    Neighbors for movement: adjacent + aerial_adjacent when is_aerial (deduped, order preserved).
+    Read-only: without extra aerial edges this is the definition's own adjacent list.
+    """
     if not territory_def:
         return []
+    extra = getattr(territory_def, "aerial_adjacent", None) if is_aerial else None
+    if not extra:
+        return territory_def.adjacent
     adj = list(territory_def.adjacent)
-    if is_aerial:
-        extra = getattr(territory_def, "aerial_adjacent", None) or []
-        seen = set(adj)
-        for tid in extra:
-            if tid not in seen:
-                seen.add(tid)
-                adj.append(tid)
+    seen = set(adj)
+    for tid in extra:
+        if tid not in seen:
+            seen.add(tid)
+            adj.append(tid)
     return adj
 
 
@@ -885,10 +889,16 @@ def remaining_ford_escort_slots(
 
 
 def _land_adjacent_and_ford_edges(territory_def: TerritoryDefinition) -> list[str]:
-    """Ground connectivity (adjacent + ford_adjacent, deduped). For shortest-path checks."""
+    """
+    Ground connectivity (adjacent + ford_adjacent, deduped). For shortest-path checks.
+    Read-only: without ford edges this is the definition's own adjacent list.
+    """
+    fords = getattr(territory_def, "ford_adjacent", None)
+    if not fords:
+        return territory_def.adjacent
     adj = list(territory_def.adjacent)
     seen = set(adj)
-    for fid in getattr(territory_def, "ford_adjacent", []) or []:
+    for fid in fords:
         if fid not in seen:
             seen.add(fid)
             adj.append(fid)
@@ -987,26 +997,29 @@ def _can_reach_friendly_from(
         return True
     if moves_left == 0:
         return False
+    # One BFS level per remaining move: plain id lists, no (tid, steps) tuple per queued territory
     visited = {from_territory_id}
-    queue: deque[tuple[str, int]] = deque([(from_territory_id, 0)])
-    while queue:
-        tid, steps = queue.popleft()
-        if steps >= moves_left:
-            continue
-        tdef = territory_defs.get(tid)
-        if not tdef:
-            continue
-        for adj_id in _adjacent_ids(tdef, for_aerial):
-            if adj_id in visited:
+    frontier = [from_territory_id]
+    for _ in range(moves_left):
+        next_frontier: list[str] = []
+        for tid in frontier:
+            tdef = territory_defs.get(tid)
+            if not tdef:
                 continue
-            visited.add(adj_id)
-            adj_territory = state.territories.get(adj_id)
-            if adj_territory and _is_friendly_territory_for_landing(
-                adj_territory, current_faction, faction_defs, unit_defs,
-                state=state, territory_id=adj_id,
-            ):
-                return True
-            queue.append((adj_id, steps + 1))
+            for adj_id in _adjacent_ids(tdef, for_aerial):
+                if adj_id in visited:
+                    continue
+                visited.add(adj_id)
+                adj_territory = state.territories.get(adj_id)
+                if adj_territory and _is_friendly_territory_for_landing(
+                    adj_territory, current_faction, faction_defs, unit_defs,
+                    state=state, territory_id=adj_id,
+                ):
+                    return True
+                next_frontier.append(adj_id)
+        if not next_frontier:
+            break
+        frontier = next_frontier
     return False
 
 
@@ -1021,6 +1034,7 @@ def get_reachable_territories_for_unit(
     acting_faction_id: str | None = None,
     exclude_instance_ids_from_ford_pending: set[str] | None = None,
     same_move_includes_ford_crosser: bool = False,
+    cache: dict | None = None,
 ) -> tuple[dict[str, int], dict[str, list[list[str]]]]:
     """
     Calculate all territories reachable by a specific unit instance from a starting territory.
@@ -1039,6 +1053,14 @@ def get_reachable_territories_for_unit(
     includes at least one ford_crosser in the same move_units action. Escort units then treat the
     pooled ford capacity as available without a prior pending crosser-only declaration.
 
+    cache: optional dict shared by a caller across queries against the same state and the same
+    ford arguments (e.g. every unit of a stack). Units of one type with equal remaining movement
+    from the same start get the same result, so it is computed once; the returned dicts are then
+    shared between those calls and must not be mutated. Naval units in combat_move are never
+    cached (their sea-zone destinations depend on that boat's own load slots). The cache also
+    carries the per-territory classification and neighbor lists, which do not depend on the unit,
+    so every unit queried with it shares that work.
+
     Rules:
     - BFS up to remaining_movement
     - Cavalry (charging): can pass through empty enemy, empty unowned, or empty friendly/allied territory in combat_move; enemy/unowned are conquered, friendly/allied are not.
@@ -1065,6 +1087,19 @@ def get_reachable_territories_for_unit(
         else getattr(state, "current_faction", None)
     ) or ""
 
+    # Unit-type flags, evaluated once rather than per edge / per destination
+    naval_only = _is_naval_only(unit_def)
+    enters_sea = _can_unit_enter_sea(unit_def)
+    land_unit = is_land_unit(unit_def)
+    unit_transportable = is_transportable(unit_def)
+
+    cache_key = None
+    if cache is not None and not (phase == "combat_move" and naval_only):
+        cache_key = (unit.unit_id, start, max_move, phase, cf)
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return hit
+
     is_aerial = (
         getattr(unit_def, "archetype", "") == "aerial"
         or "aerial" in getattr(unit_def, "tags", [])
@@ -1074,10 +1109,51 @@ def get_reachable_territories_for_unit(
         or "cavalry" in getattr(unit_def, "tags", [])
     )
     can_enter_enemy = phase == "combat_move"
+    # Cavalry in combat_move may charge through empty territory; every other case skips that check
+    charging = is_cavalry and can_enter_enemy
     current_faction_def = faction_defs.get(cf)
+    current_alliance = current_faction_def.alliance if current_faction_def else None
+
+    # territory_id -> (is_neutral, is_enemy_territory, is_allied_territory, neutral_has_enemies).
+    # Owners and occupants do not change during this call, and the BFS, the destination filter and
+    # the sea-raid pass look at the same territories, so each is classified once.
+    territory_classes: dict[str, tuple[bool, bool, bool, bool]] = (
+        cache.setdefault(("territory_classes", cf), {}) if cache is not None else {}
+    )
+
+    def classify(territory_id: str, territory: TerritoryState) -> tuple[bool, bool, bool, bool]:
+        flags = territory_classes.get(territory_id)
+        if flags is not None:
+            return flags
+        eo = effective_territory_owner(state, territory_id)
+        is_neutral = eo is None
+        is_enemy_territory = eo is not None and eo != cf
+        is_allied_territory = False
+        if is_enemy_territory and current_faction_def:
+            owner_faction_def = faction_defs.get(eo)
+            if owner_faction_def and owner_faction_def.alliance == current_alliance:
+                is_allied_territory = True
+        neutral_has_enemies = False
+        if is_neutral and current_faction_def:
+            for u in territory.units:
+                ud = unit_defs.get(u.unit_id)
+                unit_faction = ud.faction if ud else None
+                unit_faction_def = faction_defs.get(unit_faction) if unit_faction else None
+                if not unit_faction_def or unit_faction_def.alliance != current_alliance:
+                    neutral_has_enemies = True
+                    break
+        flags = (is_neutral, is_enemy_territory, is_allied_territory, neutral_has_enemies)
+        territory_classes[territory_id] = flags
+        return flags
+
+    # sea zone id -> holds boats hostile to cf (naval BFS: attack there, never sail through).
+    # Same once-per-call reasoning as territory_classes.
+    sea_has_enemy_boats: dict[str, bool] = (
+        cache.setdefault(("sea_has_enemy_boats", cf), {}) if cache is not None else {}
+    )
 
     forced_naval_ids: set[str] = set()
-    if phase == "combat_move" and _is_naval_only(unit_def):
+    if phase == "combat_move" and naval_only:
         forced_naval_ids = set(
             get_forced_naval_combat_instance_ids(
                 state, cf, unit_defs, territory_defs, faction_defs
@@ -1086,10 +1162,10 @@ def get_reachable_territories_for_unit(
 
     is_ford_crosser = has_unit_special(unit_def, "ford_crosser")
     uses_ford_budget = (
-        is_land_unit(unit_def)
+        land_unit
         and not is_aerial
         and not is_ford_crosser
-        and is_transportable(unit_def)
+        and unit_transportable
     )
     ford_exclude = exclude_instance_ids_from_ford_pending or set()
     remaining_ford = remaining_ford_escort_slots(
@@ -1105,177 +1181,34 @@ def get_reachable_territories_for_unit(
         remaining_ford = 0
 
     reachable = {}  # territory_id -> distance
+    filtered_reachable: dict[str, int] = {}  # reachable territories that are legal destinations
     charge_routes: dict[str, list[list[str]]] = {}  # territory_id -> list of charge_through paths
-    # For cavalry we track (tid, charge) to allow multiple paths; key = (tid, tuple(charge))
+    charge_routes_seen: dict[str, set[tuple[str, ...]]] = {}  # same paths as tuples, for membership
+    # For cavalry we track (tid, charge) to allow multiple paths; key = (tid, charge). Each distinct
+    # charge route is a separate choice for the player (it decides what gets conquered on the way),
+    # so states are not merged per territory. charge is carried as a tuple so it keys visited as-is.
     # When uses_ford_budget, key includes ford_used along the path (ford-only edges).
     visited: dict[tuple, int] = {}
-    queue: deque[tuple[str, int, list[str], int]] = deque([(start, 0, [], 0)])
-
-    while queue:
-        territory_id, distance, charge, ford_used = queue.popleft()
-        charge_key = (territory_id, tuple(charge))
-
-        # Only record as reachable if within movement range (never allow > remaining_movement)
-        if distance > 0 and distance <= max_move:
-            reachable[territory_id] = min(reachable.get(territory_id, 999), distance)
-            if is_cavalry and can_enter_enemy:
-                # Via path must never include the destination (no "Via Pelennor" when moving to Pelennor)
-                via_path = [t for t in charge if t != territory_id]
-                charge_routes.setdefault(territory_id, [])
-                if via_path not in charge_routes[territory_id]:
-                    charge_routes[territory_id].append(via_path)
-
-        if distance >= max_move:
-            continue
-
-        territory_def = territory_defs.get(territory_id)
-        if not territory_def:
-            continue
-
-        neighbors = _land_move_neighbors_with_ford(
-            territory_def, is_aerial, is_ford_crosser
-        )
-        for adjacent_id, is_ford_budget_step in neighbors:
-            # Only transportable land (plus crossers/aerials via neighbor rules) may use ford-only edges / escort pool.
-            if (
-                is_ford_budget_step
-                and not is_ford_crosser
-                and not is_aerial
-                and not is_transportable(unit_def)
-            ):
-                continue
-            if is_ford_budget_step and ford_used + 1 > remaining_ford:
-                continue
-            new_fu = ford_used + (1 if is_ford_budget_step else 0)
-            new_distance = distance + 1
-            adj_def = territory_defs.get(adjacent_id)
-            if _is_sea_zone(adj_def) and not _can_unit_enter_sea(unit_def):
-                # Land unit can load into adjacent sea zone (cost 1); add to reachable but do not expand from sea
-                if new_distance <= max_move and adjacent_id not in reachable:
-                    reachable[adjacent_id] = new_distance
-                continue
-            if not _is_sea_zone(adj_def) and _is_naval_only(unit_def):
-                continue
-            adjacent_territory = state.territories.get(adjacent_id)
-            if not adjacent_territory:
-                continue
-
-            # Naval movement: sea zones with enemy boats are hostile — valid destination (attack) but do not sail through
-            if _is_naval_only(unit_def) and _is_sea_zone(adj_def):
-                has_enemy_boats = False
-                for u in adjacent_territory.units:
-                    uf = get_unit_faction(u, unit_defs)
-                    if uf and uf != cf and current_faction_def:
-                        ufd = faction_defs.get(uf)
-                        if ufd and ufd.alliance != current_faction_def.alliance:
-                            has_enemy_boats = True
-                            break
-                    elif not uf:
-                        has_enemy_boats = True
-                        break
-                if has_enemy_boats:
-                    if new_distance <= max_move and (
-                        adjacent_id not in reachable or new_distance < reachable[adjacent_id]
-                    ):
-                        reachable[adjacent_id] = new_distance
-                    continue
-
-            eo = effective_territory_owner(state, adjacent_id)
-            is_neutral = eo is None
-            is_enemy_territory = eo is not None and eo != cf
-            is_allied_territory = False
-            if is_enemy_territory and current_faction_def:
-                owner_faction_def = faction_defs.get(eo)
-                if owner_faction_def and owner_faction_def.alliance == current_faction_def.alliance:
-                    is_allied_territory = True
-
-            neutral_has_enemies = False
-            if is_neutral and current_faction_def:
-                for u in adjacent_territory.units:
-                    ud = unit_defs.get(u.unit_id)
-                    unit_faction = ud.faction if ud else None
-                    unit_faction_def = faction_defs.get(unit_faction) if unit_faction else None
-                    if unit_faction_def and unit_faction_def.alliance != current_faction_def.alliance:
-                        neutral_has_enemies = True
-                        break
-                    elif not unit_faction_def:
-                        neutral_has_enemies = True
-                        break
+    queue: deque[tuple[str, int, tuple[str, ...], int]] = deque([(start, 0, (), 0)])
+    # territory_id -> [(adjacent_id, is_ford_budget_step, adjacent def, adjacent is sea)]. Built on a
+    # territory's first expansion; cavalry and ford-budget searches dequeue a territory once per
+    # distinct charge/ford state and reuse it.
+    neighbor_steps: dict[str, list[tuple[str, bool, TerritoryDefinition | None, bool]]] = (
+        cache.setdefault(("neighbor_steps", is_aerial, is_ford_crosser), {})
+        if cache is not None
+        else {}
+    )
 
-            adjacent_ownable = getattr(adj_def, "ownable", True)
-            adjacent_has_any_units = len(adjacent_territory.units) > 0
-            # Cavalry "open space" for charge: EMPTY (enemy or unowned ownable) OR friendly/allied. Can charge through any of these.
-            adjacent_empty_enemy = (
-                is_enemy_territory and not is_allied_territory
-                and not adjacent_has_any_units
-            )
-            adjacent_empty_unowned = (
-                is_neutral and not neutral_has_enemies and not adjacent_has_any_units and adjacent_ownable
-            )
-            adjacent_friendly_or_allied = eo == cf or is_allied_territory
-            can_charge_through = (
-                adjacent_empty_enemy or adjacent_empty_unowned or adjacent_friendly_or_allied
-            )
-            new_charge = charge + [adjacent_id] if (is_cavalry and can_enter_enemy and can_charge_through) else charge
-            if uses_ford_budget:
-                adj_key = (adjacent_id, tuple(new_charge), new_fu)
-            else:
-                adj_key = (adjacent_id, tuple(new_charge))
-
-            can_pass = True
-            if is_enemy_territory and not is_allied_territory and not can_enter_enemy and not is_aerial:
-                can_pass = False
-            if is_enemy_territory and not is_allied_territory and can_enter_enemy and not is_aerial and not (is_cavalry and can_charge_through):
-                can_pass = False
-            if is_neutral and phase == "combat_move" and neutral_has_enemies and not is_aerial:
-                can_pass = False
-            if can_pass:
-                if adj_key not in visited or new_distance < visited[adj_key]:
-                    visited[adj_key] = new_distance
-                    queue.append((adjacent_id, new_distance, new_charge, new_fu))
-            elif phase == "combat_move" and not is_aerial and new_distance <= max_move:
-                if (is_enemy_territory and not is_allied_territory) or (is_neutral and neutral_has_enemies):
-                    if adjacent_id not in reachable or new_distance < reachable[adjacent_id]:
-                        reachable[adjacent_id] = new_distance
-                    if is_cavalry:
-                        via_path = [t for t in charge if t != adjacent_id]
-                        charge_routes.setdefault(adjacent_id, [])
-                        if via_path not in charge_routes[adjacent_id]:
-                            charge_routes[adjacent_id].append(via_path)
-
-    # Filter destinations based on phase and unit type
-    filtered_reachable = {}
-    for territory_id, dist in reachable.items():
+    def can_end(territory_id: str, dist: int) -> bool:
+        """Whether territory_id is a legal destination for this unit and phase at distance dist."""
         territory = state.territories.get(territory_id)
         if not territory:
-            continue
+            return False
         territory_def = territory_defs.get(territory_id)
         is_ownable = getattr(territory_def, "ownable", True)
-
-        eff_o = effective_territory_owner(state, territory_id)
-        is_neutral = eff_o is None
-        is_enemy_territory = eff_o is not None and eff_o != cf
-
-        # Check if it's allied territory
-        is_allied_territory = False
-        if is_enemy_territory and current_faction_def:
-            owner_faction_def = faction_defs.get(eff_o)
-            if owner_faction_def and owner_faction_def.alliance == current_faction_def.alliance:
-                is_allied_territory = True
-
-        # Check if neutral territory has enemy units
-        neutral_has_enemies = False
-        if is_neutral and current_faction_def:
-            for u in territory.units:
-                ud = unit_defs.get(u.unit_id)
-                unit_faction = ud.faction if ud else None
-                unit_faction_def = faction_defs.get(unit_faction) if unit_faction else None
-                if unit_faction_def and unit_faction_def.alliance != current_faction_def.alliance:
-                    neutral_has_enemies = True
-                    break
-                elif not unit_faction_def:
-                    neutral_has_enemies = True
-                    break
+        is_neutral, is_enemy_territory, is_allied_territory, neutral_has_enemies = classify(
+            territory_id, territory
+        )
 
         # Apply phase-specific filters
         territory_def_for_filter = territory_defs.get(territory_id)
@@ -1284,11 +1217,11 @@ def get_reachable_territories_for_unit(
             # Combat move: enemy territory; neutral with enemies (attack); empty neutral ownable (conquer); adjacent sea zone (load).
             # Aerial: can only move into territories that have units to attack. No empty destinations.
             # Naval: sea zones with enemy units (naval combat); also allow empty reachable sea zones so sail+offload/sea raid works.
-            if is_sea and _is_naval_only(unit_def):
+            if is_sea and naval_only:
                 if is_enemy_territory and not is_allied_territory and len(territory.units) > 0:
-                    filtered_reachable[territory_id] = dist
+                    return True
                 elif is_neutral and neutral_has_enemies:
-                    filtered_reachable[territory_id] = dist
+                    return True
                 elif empty_sea_zone_valid_for_combat_move_sail_then_load_raid(
                     state,
                     territory_id,
@@ -1300,7 +1233,7 @@ def get_reachable_territories_for_unit(
                     faction_defs,
                     phase,
                 ):
-                    filtered_reachable[territory_id] = dist
+                    return True
                 elif (
                     unit.instance_id in forced_naval_ids
                     and dist == 1
@@ -1308,18 +1241,18 @@ def get_reachable_territories_for_unit(
                         state, territory_id, cf, unit_defs, faction_defs, territory_defs
                     )
                 ):
-                    filtered_reachable[territory_id] = dist
-            elif is_sea and not _can_unit_enter_sea(unit_def) and dist == 1:
+                    return True
+            elif is_sea and not enters_sea and dist == 1:
                 # Land unit loading into adjacent sea zone (transportable only; hide when no slots left)
                 if (
-                    is_land_unit(unit_def)
-                    and is_transportable(unit_def)
+                    land_unit
+                    and unit_transportable
                     and remaining_sea_load_passenger_slots(
                         state, territory_id, cf, unit_defs, territory_defs, phase
                     )
                     > 0
                 ):
-                    filtered_reachable[territory_id] = dist
+                    return True
             elif is_sea and is_aerial:
                 # Aerial vs ships: must keep enough movement to reach friendly land after (same check as land attacks).
                 if len(territory.units) == 0:
@@ -1338,7 +1271,7 @@ def get_reachable_territories_for_unit(
                 elif (is_enemy_territory and not is_allied_territory) or (
                     is_neutral and neutral_has_enemies
                 ):
-                    filtered_reachable[territory_id] = dist
+                    return True
             elif is_enemy_territory and not is_allied_territory:
                 territory_has_units = len(territory.units) > 0
                 if is_aerial:
@@ -1347,9 +1280,9 @@ def get_reachable_territories_for_unit(
                         state, territory_defs, faction_defs, unit_defs, cf,
                         for_aerial=True,
                     ):
-                        filtered_reachable[territory_id] = dist
+                        return True
                 else:
-                    filtered_reachable[territory_id] = dist
+                    return True
             elif is_neutral and neutral_has_enemies:
                 # Sea zones with enemy units, or hostile neutrals (e.g. goblins). Aerial: allow if can reach friendly (land) after.
                 if is_aerial:
@@ -1358,49 +1291,190 @@ def get_reachable_territories_for_unit(
                         state, territory_defs, faction_defs, unit_defs, cf,
                         for_aerial=True,
                     ):
-                        filtered_reachable[territory_id] = dist
+                        return True
                 else:
-                    filtered_reachable[territory_id] = dist  # hostile neutral (e.g. goblins, cave trolls) - attack it
+                    return True  # hostile neutral (e.g. goblins, cave trolls) - attack it
             elif is_neutral and not neutral_has_enemies and is_ownable:
                 # Empty unowned ownable: ground can move in and capture. Aerial cannot (no combat move into empty).
                 if not is_aerial:
-                    filtered_reachable[territory_id] = dist
+                    return True
             # Note: friendly/allied territories are NOT valid combat_move destinations (except load into sea)
         elif phase == "non_combat_move":
             # Non-combat move: friendly or allied; empty unownable (pass-through); adjacent sea zone (load).
             territory_def_ncm = territory_defs.get(territory_id)
             is_sea_ncm = territory_def_ncm and _is_sea_zone(territory_def_ncm)
-            if is_sea_ncm and _is_naval_only(unit_def):
+            if is_sea_ncm and naval_only:
                 # Naval: sail to any reachable sea zone
-                filtered_reachable[territory_id] = dist
-            elif is_sea_ncm and not _can_unit_enter_sea(unit_def) and dist == 1:
+                return True
+            elif is_sea_ncm and not enters_sea and dist == 1:
                 if (
-                    is_land_unit(unit_def)
-                    and is_transportable(unit_def)
+                    land_unit
+                    and unit_transportable
                     and remaining_sea_load_passenger_slots(
                         state, territory_id, cf, unit_defs, territory_defs, phase
                     )
                     > 0
                 ):
-                    filtered_reachable[territory_id] = dist
+                    return True
             elif is_neutral:
                 if not neutral_has_enemies and not is_ownable:
-                    filtered_reachable[territory_id] = dist  # empty unownable neutral only (e.g. pass-through)
+                    return True  # empty unownable neutral only (e.g. pass-through)
             elif not is_enemy_territory or is_allied_territory:
                 # Friendly or allied only; exclude ownable neutral (conquest is combat_move only)
                 if is_neutral and is_ownable:
                     pass
                 else:
-                    filtered_reachable[territory_id] = dist
+                    return True
         else:
             # Other phases: include all reachable
+            return True
+
+        return False
+
+    def record(territory_id: str, dist: int) -> None:
+        # BFS dequeues in distance order, so the first distance recorded for a territory is its
+        # shortest; the destination filter runs once, right then, instead of in a second pass.
+        reachable[territory_id] = dist
+        if can_end(territory_id, dist):
             filtered_reachable[territory_id] = dist
 
+    def arrive(territory_id: str, distance: int, charge: tuple[str, ...]) -> None:
+        if territory_id not in reachable:
+            record(territory_id, distance)
+        if is_cavalry and can_enter_enemy:
+            # Via path must never include the destination (no "Via Pelennor" when moving to Pelennor)
+            via_path = tuple(t for t in charge if t != territory_id)
+            seen = charge_routes_seen.setdefault(territory_id, set())
+            if via_path not in seen:
+                seen.add(via_path)
+                charge_routes.setdefault(territory_id, []).append(list(via_path))
+
+    # Passable states at distance max_move expand no further, so they skip visited/queue and are
+    # collected here; they are arrived at after the search, which is the order BFS would dequeue them.
+    # With remaining_movement 1 this leaves a single expansion of start.
+    last_step: list[tuple[str, tuple[str, ...]]] = []
+
+    while queue:
+        territory_id, distance, charge, ford_used = queue.popleft()
+
+        # Only record as reachable if within movement range (never allow > remaining_movement)
+        if distance > 0 and distance <= max_move:
+            arrive(territory_id, distance, charge)
+
+        if distance >= max_move:
+            continue
+
+        neighbors = neighbor_steps.get(territory_id)
+        if neighbors is None:
+            territory_def = territory_defs.get(territory_id)
+            if not territory_def:
+                continue
+            neighbors = []
+            for adjacent_id, is_ford_budget_step in _land_move_neighbors_with_ford(
+                territory_def, is_aerial, is_ford_crosser
+            ):
+                adj_def = territory_defs.get(adjacent_id)
+                neighbors.append((adjacent_id, is_ford_budget_step, adj_def, _is_sea_zone(adj_def)))
+            neighbor_steps[territory_id] = neighbors
+        for adjacent_id, is_ford_budget_step, adj_def, adj_is_sea in neighbors:
+            # Only transportable land (plus crossers/aerials via neighbor rules) may use ford-only edges / escort pool.
+            if (
+                is_ford_budget_step
+                and not is_ford_crosser
+                and not is_aerial
+                and not unit_transportable
+            ):
+                continue
+            if is_ford_budget_step and ford_used + 1 > remaining_ford:
+                continue
+            new_fu = ford_used + (1 if is_ford_budget_step else 0)
+            new_distance = distance + 1
+            if adj_is_sea and not enters_sea:
+                # Land unit can load into adjacent sea zone (cost 1); add to reachable but do not expand from sea
+                if new_distance <= max_move and adjacent_id not in reachable:
+                    record(adjacent_id, new_distance)
+                continue
+            if not adj_is_sea and naval_only:
+                continue
+            adjacent_territory = state.territories.get(adjacent_id)
+            if not adjacent_territory:
+                continue
+
+            # Naval movement: sea zones with enemy boats are hostile — valid destination (attack) but do not sail through
+            if naval_only and adj_is_sea:
+                has_enemy_boats = sea_has_enemy_boats.get(adjacent_id)
+                if has_enemy_boats is None:
+                    has_enemy_boats = False
+                    for u in adjacent_territory.units:
+                        uf = get_unit_faction(u, unit_defs)
+                        if uf and uf != cf and current_faction_def:
+                            ufd = faction_defs.get(uf)
+                            if ufd and ufd.alliance != current_alliance:
+                                has_enemy_boats = True
+                                break
+                        elif not uf:
+                            has_enemy_boats = True
+                            break
+                    sea_has_enemy_boats[adjacent_id] = has_enemy_boats
+                if has_enemy_boats:
+                    if new_distance <= max_move and adjacent_id not in reachable:
+                        record(adjacent_id, new_distance)
+                    continue
+
+            is_neutral, is_enemy_territory, is_allied_territory, neutral_has_enemies = classify(
+                adjacent_id, adjacent_territory
+            )
+
+            can_charge_through = False
+            if charging:
+                adjacent_has_any_units = len(adjacent_territory.units) > 0
+                # Cavalry "open space" for charge: EMPTY (enemy or unowned ownable) OR friendly/allied. Can charge through any of these.
+                adjacent_empty_enemy = (
+                    is_enemy_territory and not is_allied_territory
+                    and not adjacent_has_any_units
+                )
+                adjacent_empty_unowned = (
+                    is_neutral and not neutral_has_enemies and not adjacent_has_any_units
+                    and getattr(adj_def, "ownable", True)
+                )
+                # Owned by cf itself (eo == cf), or by an ally
+                adjacent_friendly_or_allied = (not is_neutral and not is_enemy_territory) or is_allied_territory
+                can_charge_through = (
+                    adjacent_empty_enemy or adjacent_empty_unowned or adjacent_friendly_or_allied
+                )
+            if is_aerial:
+                can_pass = True
+            elif is_enemy_territory and not is_allied_territory:
+                # Ground units stop at enemy territory; only charging cavalry passes through empty ones
+                can_pass = can_charge_through
+            elif is_neutral and neutral_has_enemies:
+                can_pass = not can_enter_enemy
+            else:
+                can_pass = True
+            if can_pass:
+                new_charge = charge + (adjacent_id,) if can_charge_through else charge
+                if new_distance == max_move:
+                    last_step.append((adjacent_id, new_charge))
+                    continue
+                if uses_ford_budget:
+                    adj_key = (adjacent_id, new_charge, new_fu)
+                else:
+                    adj_key = (adjacent_id, new_charge)
+                if adj_key not in visited or new_distance < visited[adj_key]:
+                    visited[adj_key] = new_distance
+                    queue.append((adjacent_id, new_distance, new_charge, new_fu))
+            elif can_enter_enemy:
+                # Blocked in combat_move: enemy territory or hostile neutral, a valid attack destination
+                arrive(adjacent_id, new_distance, charge)
+
+    for territory_id, charge in last_step:
+        arrive(territory_id, max_move, charge)
+
     # Combat move: for naval-only units, add land territories adjacent to *any* reachable sea zone as sea-raid targets
     # (use reachable, not filtered_reachable: sea zones may not be in filtered_reachable for naval, but they are in reachable)
-    if phase == "combat_move" and _is_naval_only(unit_def):
+    if phase == "combat_move" and naval_only:
         sea_raid_land: dict[str, int] = {}
-        for sea_id, dist in list(reachable.items()):
+        for sea_id, dist in reachable.items():
             sea_def = territory_defs.get(sea_id)
             if not sea_def or not _is_sea_zone(sea_def):
                 continue
@@ -1412,32 +1486,11 @@ def get_reachable_territories_for_unit(
                 if not adj_territory:
                     continue
                 is_ownable = getattr(adj_def, "ownable", True)
-                adj_eo = effective_territory_owner(state, adj_id)
-                is_neutral = adj_eo is None
-                is_enemy = adj_eo is not None and adj_eo != cf
-                is_allied = False
-                if is_enemy and current_faction_def:
-                    owner_def = faction_defs.get(adj_eo)
-                    if owner_def and owner_def.alliance == current_faction_def.alliance:
-                        is_allied = True
-                neutral_has_enemies = False
-                if is_neutral and current_faction_def:
-                    for u in adj_territory.units:
-                        ud = unit_defs.get(u.unit_id)
-                        uf = ud.faction if ud else None
-                        ufd = faction_defs.get(uf) if uf else None
-                        if ufd and ufd.alliance != current_faction_def.alliance:
-                            neutral_has_enemies = True
-                            break
-                        if not ufd:
-                            neutral_has_enemies = True
-                            break
-                if is_enemy and not is_allied:
-                    sea_raid_land[adj_id] = min(sea_raid_land.get(adj_id, 999), dist)
-                elif is_neutral and neutral_has_enemies:
-                    sea_raid_land[adj_id] = min(sea_raid_land.get(adj_id, 999), dist)
-                elif is_neutral and not neutral_has_enemies and is_ownable:
-                    sea_raid_land[adj_id] = min(sea_raid_land.get(adj_id, 999), dist)
+                is_neutral, is_enemy, is_allied, neutral_has_enemies = classify(adj_id, adj_territory)
+                # Enemy land, hostile neutral, or empty ownable neutral
+                if (is_enemy and not is_allied) or (is_neutral and (neutral_has_enemies or is_ownable)):
+                    if adj_id not in sea_raid_land or dist < sea_raid_land[adj_id]:
+                        sea_raid_land[adj_id] = dist
         for tid, d in sea_raid_land.items():
             if tid not in filtered_reachable or d < filtered_reachable[tid]:
                 filtered_reachable[tid] = d
@@ -1450,9 +1503,50 @@ def get_reachable_territories_for_unit(
         tid: paths for tid, paths in charge_routes.items()
         if tid in filtered_reachable
     }
+    if cache_key is not None:
+        cache[cache_key] = (filtered_reachable, charge_routes_filtered)
     return filtered_reachable, charge_routes_filtered
 
 
+def _charge_open_space(
+    terr: TerritoryState,
+    tdef: TerritoryDefinition,
+    faction_id: str,
+    current_faction_def: FactionDefinition | None,
+    faction_defs: dict[str, FactionDefinition],
+    unit_defs: dict[str, UnitDefinition],
+) -> tuple[bool, bool]:
+    """
+    (conquerable, passable) for multi-turn charge lookahead on a land territory.
+    conquerable: empty enemy, or empty neutral ownable. passable: conquerable, or friendly/allied.
+    """
+    owner = terr.owner
+    current_alliance = getattr(current_faction_def, "alliance", "") if current_faction_def else ""
+    is_neutral = owner is None
+    is_enemy = owner is not None and owner != faction_id
+    is_allied = False
+    if is_enemy and current_faction_def:
+        od = faction_defs.get(owner)
+        if od and getattr(od, "alliance", "") == current_alliance:
+            is_allied = True
+    units = getattr(terr, "units", []) or []
+    has_units = len(units) > 0
+    neutral_has_enemies = False
+    if is_neutral and current_faction_def:
+        for u in units:
+            uf = get_unit_faction(u, unit_defs)
+            ufd = faction_defs.get(uf) if uf else None
+            if not ufd or getattr(ufd, "alliance", "") != current_alliance:
+                neutral_has_enemies = True
+                break
+    ownable = getattr(tdef, "ownable", True)
+    empty_enemy = is_enemy and not is_allied and not has_units
+    empty_neutral_ownable = is_neutral and not neutral_has_enemies and not has_units and ownable
+    friendly_or_allied = owner == faction_id or is_allied
+    conquerable = empty_enemy or empty_neutral_ownable
+    return conquerable, conquerable or friendly_or_allied
+
+
 def get_charge_reachable_over_moves(
     start_territory_id: str,
     state: GameState,
@@ -1489,32 +1583,11 @@ def get_charge_reachable_over_moves(
         is_sea = _is_sea_zone(tdef)
         if is_sea:
             continue
-        is_neutral = terr.owner is None
-        is_enemy = terr.owner is not None and terr.owner != faction_id
-        is_allied = False
-        if is_enemy and current_faction_def:
-            od = faction_defs.get(terr.owner)
-            if od and getattr(od, "alliance", "") == getattr(current_faction_def, "alliance", ""):
-                is_allied = True
-        has_units = len(getattr(terr, "units", []) or []) > 0
-        neutral_has_enemies = False
-        if is_neutral and current_faction_def:
-            for u in getattr(terr, "units", []) or []:
-                uf = get_unit_faction(u, unit_defs)
-                ufd = faction_defs.get(uf) if uf else None
-                if ufd and getattr(ufd, "alliance", "") != getattr(current_faction_def, "alliance", ""):
-                    neutral_has_enemies = True
-                    break
-                if not ufd:
-                    neutral_has_enemies = True
-                    break
-        ownable = getattr(tdef, "ownable", True)
-        empty_enemy = is_enemy and not is_allied and not has_units
-        empty_neutral_ownable = is_neutral and not neutral_has_enemies and not has_units and ownable
-        friendly_or_allied = terr.owner == faction_id or is_allied
-        if empty_enemy or empty_neutral_ownable:
+        is_conquerable, can_pass = _charge_open_space(
+            terr, tdef, faction_id, current_faction_def, faction_defs, unit_defs
+        )
+        if is_conquerable:
             conquerable.add(tid)
-        can_pass = empty_enemy or empty_neutral_ownable or friendly_or_allied
         if not can_pass or steps >= movement_range:
             continue
         for adj_id in getattr(tdef, "adjacent", []) or []:
@@ -1549,6 +1622,8 @@ def get_charge_max_gain_over_moves(
     exclude = exclude_tids or set()
     current_faction_def = faction_defs.get(faction_id)
 
+    # tid -> _charge_open_space result; the search reaches a territory once per step count and gain
+    open_space: dict[str, tuple[bool, bool]] = {}
     # (tid, steps_used) -> best total gain achievable when at tid after steps_used
     best: dict[tuple[str, int], float] = {}
     queue: deque[tuple[str, int, float]] = deque([(start_territory_id, 0, 0.0)])
@@ -1575,35 +1650,17 @@ def get_charge_max_gain_over_moves(
             adj_terr = state.territories.get(adj_id)
             if not adj_terr:
                 continue
-            is_neutral = adj_terr.owner is None
-            is_enemy = adj_terr.owner is not None and adj_terr.owner != faction_id
-            is_allied = False
-            if is_enemy and current_faction_def:
-                od = faction_defs.get(adj_terr.owner)
-                if od and getattr(od, "alliance", "") == getattr(current_faction_def, "alliance", ""):
-                    is_allied = True
-            has_units = len(getattr(adj_terr, "units", []) or []) > 0
-            neutral_has_enemies = False
-            if is_neutral and current_faction_def:
-                for u in getattr(adj_terr, "units", []) or []:
-                    uf = get_unit_faction(u, unit_defs)
-                    ufd = faction_defs.get(uf) if uf else None
-                    if ufd and getattr(ufd, "alliance", "") != getattr(current_faction_def, "alliance", ""):
-                        neutral_has_enemies = True
-                        break
-                    if not ufd:
-                        neutral_has_enemies = True
-                        break
-            ownable = getattr(adj_def, "ownable", True)
-            empty_enemy = is_enemy and not is_allied and not has_units
-            empty_neutral_ownable = is_neutral and not neutral_has_enemies and not has_units and ownable
-            friendly_or_allied = adj_terr.owner == faction_id or is_allied
-            can_pass = empty_enemy or empty_neutral_ownable or friendly_or_allied
+            space = open_space.get(adj_id)
+            if space is None:
+                space = open_space[adj_id] = _charge_open_space(
+                    adj_terr, adj_def, faction_id, current_faction_def, faction_defs, unit_defs
+                )
+            is_conquerable, can_pass = space
             if not can_pass:
                 continue
             new_steps = steps + 1
             add_gain = 0.0
-            if (empty_enemy or empty_neutral_ownable) and adj_id not in exclude:
+            if is_conquerable and adj_id not in exclude:
                 add_gain = float(gain_fn(adj_id)) if callable(gain_fn) else 0.0
             new_gain = total_gain + add_gain
             key = (adj_id, new_steps)
@@ -1760,9 +1817,34 @@ def calculate_movement_cost(
     """
     Calculate the minimum movement cost (distance) between two territories using BFS.
     When is_aerial, may use aerial_adjacent edges.
+    Same graph and result as len(get_shortest_path(...)) - 1, but expands one BFS level at a
+    time and counts levels instead of recording parents and rebuilding the path.
     """
-    path = get_shortest_path(start, end, territory_defs, is_aerial=is_aerial)
-    return len(path) - 1 if path else None
+    if start == end:
+        return 0
+    visited = {start}
+    frontier = [start]
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier: list[str] = []
+        for territory_id in frontier:
+            territory_def = territory_defs.get(territory_id)
+            if not territory_def:
+                continue
+            neighbor_ids = (
+                _adjacent_ids(territory_def, is_aerial)
+                if is_aerial
+                else _land_adjacent_and_ford_edges(territory_def)
+            )
+            for adjacent_id in neighbor_ids:
+                if adjacent_id == end:
+                    return distance
+                if adjacent_id not in visited:
+                    visited.add(adjacent_id)
+                    next_frontier.append(adjacent_id)
+        frontier = next_frontier
+    return None
 
 
 def movement_cost_along_path(
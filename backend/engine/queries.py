@@ -81,6 +81,20 @@ def _home_territory_ids(ud: UnitDefinition) -> list[str]:
     return list(ids) if ids else []
 
 
+def _home_units_by_territory(
+    faction_id: str,
+    unit_defs: dict[str, UnitDefinition],
+) -> dict[str, dict[str, int]]:
+    """territory_id -> {unit_id: 1} for faction_id's unit types with the home special homed there."""
+    by_territory: dict[str, dict[str, int]] = {}
+    for unit_id, ud in unit_defs.items():
+        if getattr(ud, "faction", None) != faction_id or not has_unit_special(ud, "home"):
+            continue
+        for tid in _home_territory_ids(ud):
+            by_territory.setdefault(tid, {})[unit_id] = 1
+    return by_territory
+
+
 def _sea_zone_adjacent_to_owned_port(
     state: GameState,
     sea_zone_id: str,
@@ -166,9 +180,14 @@ PHASE_ALLOWED_ACTIONS = {
     "non_combat_move": ["move_units", "cancel_move", SET_TERRITORY_DEFENDER_CASUALTY_ORDER, "end_phase", "skip_turn"],
     "mobilization": ["mobilize_units", "place_camp", "queue_camp_placement", "cancel_camp_placement", "cancel_mobilization", SET_TERRITORY_DEFENDER_CASUALTY_ORDER, "end_phase", "end_turn", "skip_turn"],
 }
+# Same rules as frozensets, for membership checks
+_PHASE_ALLOWED_ACTION_SETS = {phase: frozenset(actions) for phase, actions in PHASE_ALLOWED_ACTIONS.items()}
+# Combat phase: offered while a combat is active / only meaningful while one is
+_ACTIVE_COMBAT_ACTIONS = frozenset({"continue_combat", "retreat", SET_TERRITORY_DEFENDER_CASUALTY_ORDER})
+_COMBAT_ONLY_ACTIONS = frozenset({"continue_combat", "retreat"})
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
     """Result of action validation."""
     valid: bool
@@ -178,6 +197,10 @@ class ValidationResult:
         return {"valid": self.valid, "error": self.error}
 
 
+# Shared success result; ValidationResult is frozen, so one instance serves every validator.
+_VALID = ValidationResult(True)
+
+
 # ===== Action Validation =====
 
 def validate_action(
@@ -211,8 +234,8 @@ def validate_action(
     action_type = (str(_raw) if _raw is not None else "").strip()
 
     # Check phase allows this action type
-    allowed = PHASE_ALLOWED_ACTIONS.get(state.phase, [])
-    if action_type and action_type not in allowed:
+    if action_type and action_type not in _PHASE_ALLOWED_ACTION_SETS.get(state.phase, ()):
+        allowed = PHASE_ALLOWED_ACTIONS.get(state.phase, [])
         return ValidationResult(
             False,
             f"Cannot {action_type} during {state.phase} phase. Allowed: {allowed}"
@@ -241,55 +264,10 @@ def validate_action(
             (action_type and "set_territory_defender_casualty_order" in action_type) or
             (action_type and "defender_casualty" in action_type)):
         return _validate_set_territory_defender_casualty_order(state, action)
-    if action_type == "purchase_units":
-        return _validate_purchase(
-            state, action, unit_defs, faction_defs, territory_defs, camp_defs, port_defs
-        )
-    elif action_type == "move_units":
-        return _validate_move(state, action, unit_defs, territory_defs, faction_defs)
-    elif action_type == "initiate_combat":
-        return _validate_initiate_combat(state, action, faction_defs, unit_defs, territory_defs)
-    elif action_type == "mobilize_units":
-        return _validate_mobilize(
-            state,
-            action,
-            unit_defs,
-            territory_defs,
-            camp_defs,
-            port_defs,
-            faction_defs,
-        )
-    elif action_type == "retreat":
-        return _validate_retreat(state, action, territory_defs, faction_defs, unit_defs)
-    elif action_type == "cancel_move":
-        return _validate_cancel_move(state, action)
-    elif action_type == "cancel_mobilization":
-        return _validate_cancel_mobilization(state, action)
-    elif action_type == "purchase_camp":
-        return _validate_purchase_camp(state, action, camp_defs, territory_defs)
-    elif action_type == "repair_stronghold":
-        return _validate_repair_stronghold(state, action, territory_defs)
-    elif action_type == "place_camp":
-        return _validate_place_camp(state, action, camp_defs, territory_defs)
-    elif action_type == "queue_camp_placement":
-        return _validate_queue_camp_placement(state, action, camp_defs, territory_defs)
-    elif action_type == "cancel_camp_placement":
-        return _validate_cancel_camp_placement(state, action)
-    elif action_type == "end_phase":
-        return _validate_end_phase(
-            state,
-            faction_defs=faction_defs,
-            unit_defs=unit_defs,
-            territory_defs=territory_defs,
-            camp_defs=camp_defs,
-        )
-    elif action_type in ["end_turn", "continue_combat", "skip_turn"]:
-        return ValidationResult(True)
-
-    if (action_type == SET_TERRITORY_DEFENDER_CASUALTY_ORDER or
-            (action_type and "defender_casualty" in action_type)):
-        return _validate_set_territory_defender_casualty_order(state, action)
-    return ValidationResult(False, f"Unknown action type: {action_type or getattr(action, 'type', '?')}")
+    validator = _ACTION_VALIDATORS.get(action_type)
+    if validator is None:
+        return ValidationResult(False, f"Unknown action type: {action_type or getattr(action, 'type', '?')}")
+    return validator(state, action, unit_defs, territory_defs, faction_defs, camp_defs, port_defs)
 
 
 def _is_naval_unit(unit_def: UnitDefinition | None) -> bool:
@@ -448,7 +426,7 @@ def validate_move_as_sea_offload_if_applicable(
                     f"Passenger {u.instance_id} must be loaded onto a friendly boat in {origin} to offload.",
                 )
 
-    if charge_through is not None and isinstance(charge_through, list) and len(charge_through) > 0:
+    if charge_through is not None and isinstance(charge_through, (list, tuple)) and len(charge_through) > 0:
         return ValidationResult(
             False,
             "charge_through not allowed for sea transport offload/sea raid",
@@ -461,7 +439,7 @@ def validate_move_as_sea_offload_if_applicable(
                 f"Unit {u.instance_id} needs 1 movement to offload (has {getattr(u, 'remaining_movement', 0)})",
             )
 
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_purchase(
@@ -491,8 +469,9 @@ def _validate_purchase(
             f"Cannot purchase units: {faction_id}'s capital has been captured",
         )
 
-    # Calculate total cost
+    # Calculate total cost, and land/naval counts for the capacity check below
     total_cost: dict[str, int] = {}
+    this_land, this_naval = 0, 0
     for unit_id, count in purchases.items():
         unit_def = unit_defs.get(unit_id)
         if not unit_def:
@@ -506,6 +485,10 @@ def _validate_purchase(
 
         for resource, amount in unit_def.cost.items():
             total_cost[resource] = total_cost.get(resource, 0) + (amount * count)
+        if _is_naval_unit(unit_def):
+            this_naval += count
+        else:
+            this_land += count
 
     # Check resources
     faction_resources = state.faction_resources.get(faction_id, {})
@@ -541,13 +524,6 @@ def _validate_purchase(
     already_stacks = state.faction_purchased_units.get(faction_id, [])
     already_land, already_naval = _land_naval_counts(already_stacks)
 
-    this_land, this_naval = 0, 0
-    for unit_id, count in purchases.items():
-        if _is_naval_unit(unit_defs.get(unit_id)):
-            this_naval += count
-        else:
-            this_land += count
-
     if already_land + this_land > land_capacity:
         return ValidationResult(
             False,
@@ -561,7 +537,7 @@ def _validate_purchase(
             f"(already purchased: {already_naval} naval, this purchase: {this_naval} naval)"
         )
 
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_move(
@@ -623,19 +599,20 @@ def _validate_move(
         and _is_sea_zone(dest_def_chk)
     )
     units_in_stack = []
+    units_by_id = {u.instance_id: u for u in origin_territory.units}
     for instance_id in unit_instance_ids:
         if sea_to_land_ctx:
             unit = resolve_unit_for_move_declaration(
                 state, origin, instance_id, state.phase, territory_defs
             )
         elif sea_to_sea_ctx:
-            unit = next((u for u in origin_territory.units if u.instance_id == instance_id), None)
+            unit = units_by_id.get(instance_id)
             if not unit:
                 unit = resolve_unit_for_move_declaration(
                     state, origin, instance_id, state.phase, territory_defs
                 )
         else:
-            unit = next((u for u in origin_territory.units if u.instance_id == instance_id), None)
+            unit = units_by_id.get(instance_id)
         if not unit:
             return ValidationResult(False, f"Unit {instance_id} not found for move from {origin}")
         units_in_stack.append(unit)
@@ -662,6 +639,8 @@ def _validate_move(
     same_move_has_ford_crosser = any(
         has_unit_special(unit_defs.get(u.unit_id), "ford_crosser") for u in units_in_stack
     )
+    # Same state and ford arguments for the whole stack: same-type units pathfind once
+    reachable_cache: dict = {}
     for unit in units_in_stack:
         reachable, charge_routes = get_reachable_territories_for_unit(
             unit,
@@ -674,6 +653,7 @@ def _validate_move(
             None,
             ford_exclude,
             same_move_has_ford_crosser,
+            reachable_cache,
         )
         can_reach[unit.instance_id] = destination in reachable
         charge_routes_by_unit[unit.instance_id] = charge_routes
@@ -703,7 +683,7 @@ def _validate_move(
                             f"Non-combat move cannot target ownable neutral territory {destination} (conquest is combat move only)",
                         )
         charge_through = action.payload.get("charge_through")
-        if charge_through is not None and isinstance(charge_through, list):
+        if charge_through is not None and isinstance(charge_through, (list, tuple)):
             charge_through = [str(t) for t in charge_through]
             for unit in units_in_stack:
                 cr = charge_routes_by_unit.get(unit.instance_id, {})
@@ -860,7 +840,7 @@ def _validate_move(
                         f"Not enough ford escort capacity: need {ford_cost} slot(s) but only {ford_rem} remain "
                         f"(ford crossers' transport_capacity in {origin}, minus pending moves)",
                     )
-        return ValidationResult(True)
+        return _VALID
 
     # Not all units can reach: allow only if valid sea transport (driver + passengers, or load: land-only to sea with boats there)
     path = get_shortest_path(origin, destination, territory_defs)
@@ -945,7 +925,7 @@ def _validate_move(
                     f"{slots_left} slot(s) left (boats may be full or already reserved by pending loads this phase)",
                 )
         # Load costs 0 movement for passengers (offload/sea raid pays 1 when going ashore).
-        return ValidationResult(True)
+        return _VALID
 
     if not drivers:
         return ValidationResult(False, "At least one unit (naval or aerial) must be able to reach the destination")
@@ -968,7 +948,7 @@ def _validate_move(
     charge_through = action.payload.get("charge_through")
     if charge_through:
         return ValidationResult(False, "charge_through not allowed for sea transport moves")
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_initiate_combat(
@@ -991,8 +971,8 @@ def _validate_initiate_combat(
     territory_def = territory_defs.get(territory_id)
     combat_territory_is_sea = _is_sea_zone(territory_def)
     attacker_faction = action.faction
-    attacker_alliance = faction_defs.get(attacker_faction, FactionDefinition(
-        "", "", "", "", "")).alliance
+    alliance_of = {fid: fd.alliance for fid, fd in faction_defs.items()}
+    attacker_alliance = alliance_of.get(attacker_faction, "")
 
     if sea_zone_id:
         # Sea raid: attackers in sea zone, target is land territory
@@ -1025,8 +1005,8 @@ def _validate_initiate_combat(
             ]
         defender_units = [
             u for u in territory.units
-            if get_unit_faction(u, unit_defs) is not None
-            and faction_defs.get(get_unit_faction(u, unit_defs), FactionDefinition("", "", "", "", "")).alliance != attacker_alliance
+            if (uf := get_unit_faction(u, unit_defs)) is not None
+            and alliance_of.get(uf, "") != attacker_alliance
         ]
         if not attacker_units:
             return ValidationResult(
@@ -1034,7 +1014,7 @@ def _validate_initiate_combat(
                 f"No attacking land units in sea zone {sea_zone_id} or on territory {territory_id}",
             )
         # Allow empty defenders (conquer without battle)
-        return ValidationResult(True)
+        return _VALID
 
     if not combat_territory_is_sea:
         for unit in territory.units:
@@ -1056,9 +1036,7 @@ def _validate_initiate_combat(
         if unit_faction == attacker_faction:
             attacker_units.append(unit)
         elif unit_faction is not None:
-            unit_alliance = faction_defs.get(unit_faction, FactionDefinition(
-                "", "", "", "", "")).alliance
-            if unit_alliance != attacker_alliance:
+            if alliance_of.get(unit_faction, "") != attacker_alliance:
                 defender_units.append(unit)
 
     if not attacker_units:
@@ -1067,7 +1045,7 @@ def _validate_initiate_combat(
     if not defender_units:
         return ValidationResult(False, f"No enemy units to fight in {territory_id}")
 
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_mobilize(
@@ -1264,7 +1242,7 @@ def _validate_mobilize(
                     )
     # Land capacity (camp / port / home-only) fully validated in the land branch above.
 
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_retreat(
@@ -1310,7 +1288,7 @@ def _validate_retreat(
             f"Cannot retreat to {destination}: must be allied territory"
         )
 
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_cancel_move(state: GameState, action: Action) -> ValidationResult:
@@ -1321,7 +1299,7 @@ def _validate_cancel_move(state: GameState, action: Action) -> ValidationResult:
             False,
             f"Invalid move index: {move_index}. Pending moves: {len(state.pending_moves)}"
         )
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_cancel_mobilization(state: GameState, action: Action) -> ValidationResult:
@@ -1332,7 +1310,7 @@ def _validate_cancel_mobilization(state: GameState, action: Action) -> Validatio
             False,
             f"Invalid mobilization index: {idx}. Pending: {len(state.pending_mobilizations)}"
         )
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_purchase_camp(
@@ -1365,7 +1343,7 @@ def _validate_purchase_camp(
             options.append(tid)
     if not options:
         return ValidationResult(False, "No valid territory to place a camp (need owned territory with power production)")
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_repair_stronghold(
@@ -1382,7 +1360,7 @@ def _validate_repair_stronghold(
         return ValidationResult(False, "Stronghold repair is not available in this setup")
     repairs = action.payload.get("repairs")
     if not isinstance(repairs, list) or not repairs:
-        return ValidationResult(True)  # No repairs is valid (e.g. confirm with 0 repairs)
+        return _VALID  # No repairs is valid (e.g. confirm with 0 repairs)
     power = state.faction_resources.get(faction_id, {}).get("power", 0)
     total_hp = 0
     for r in repairs:
@@ -1417,7 +1395,7 @@ def _validate_repair_stronghold(
     total_cost = total_hp * repair_cost_per_hp
     if power < total_cost:
         return ValidationResult(False, f"Insufficient power: need {total_cost} for repairs, have {power}")
-    return ValidationResult(True)
+    return _VALID
 
 
 def valid_camp_placement_territory_ids(
@@ -1475,7 +1453,7 @@ def _validate_set_territory_defender_casualty_order(
         return ValidationResult(False, f"Unknown territory: {territory_id}")
     if territory.owner != action.faction:
         return ValidationResult(False, f"Only the owner of {territory_id} can set defensive casualty priority")
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_end_phase(
@@ -1501,9 +1479,9 @@ def _validate_end_phase(
                     False,
                     f"Cannot end combat phase while {len(contested)} unresolved battle(s) remain. Initiate and resolve or retreat from all battles first.",
                 )
-        return ValidationResult(True)
+        return _VALID
     if state.phase != "mobilization":
-        return ValidationResult(True)
+        return _VALID
     pending = getattr(state, "pending_camps", [])
     queued_indices = {p.camp_index for p in getattr(state, "pending_camp_placements", [])}
     faction_id = state.current_faction or ""
@@ -1520,7 +1498,7 @@ def _validate_end_phase(
                 False,
                 "Place or queue all camps before ending mobilization (at least one camp still has a valid placement)",
             )
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_place_camp(
@@ -1557,7 +1535,7 @@ def _validate_place_camp(
         )
     if _territory_has_standing_camp(state, territory_id, camp_defs):
         return ValidationResult(False, f"Territory {territory_id} already has a camp")
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_queue_camp_placement(
@@ -1578,7 +1556,7 @@ def _validate_queue_camp_placement(
             return ValidationResult(False, "Camp already queued for placement")
         if p.territory_id == territory_id:
             return ValidationResult(False, "Territory already has a pending camp placement")
-    return ValidationResult(True)
+    return _VALID
 
 
 def _validate_cancel_camp_placement(state: GameState, action: Action) -> ValidationResult:
@@ -1590,11 +1568,35 @@ def _validate_cancel_camp_placement(state: GameState, action: Action) -> Validat
             False,
             f"Invalid placement_index: {idx}. Pending: {len(pending)}"
         )
-    return ValidationResult(True)
+    return _VALID
 
 
 # ===== Query Functions =====
 
+# Action type -> validator(state, action, unit_defs, territory_defs, faction_defs, camp_defs, port_defs),
+# mirroring the reducer's _ACTION_HANDLERS. One dict lookup per action instead of an if/elif chain.
+_ACTION_VALIDATORS = {
+    "purchase_units": lambda s, a, ud, td, fd, cd, pd: _validate_purchase(s, a, ud, fd, td, cd, pd),
+    "move_units": lambda s, a, ud, td, fd, cd, pd: _validate_move(s, a, ud, td, fd),
+    "initiate_combat": lambda s, a, ud, td, fd, cd, pd: _validate_initiate_combat(s, a, fd, ud, td),
+    "mobilize_units": lambda s, a, ud, td, fd, cd, pd: _validate_mobilize(s, a, ud, td, cd, pd, fd),
+    "retreat": lambda s, a, ud, td, fd, cd, pd: _validate_retreat(s, a, td, fd, ud),
+    "cancel_move": lambda s, a, ud, td, fd, cd, pd: _validate_cancel_move(s, a),
+    "cancel_mobilization": lambda s, a, ud, td, fd, cd, pd: _validate_cancel_mobilization(s, a),
+    "purchase_camp": lambda s, a, ud, td, fd, cd, pd: _validate_purchase_camp(s, a, cd, td),
+    "repair_stronghold": lambda s, a, ud, td, fd, cd, pd: _validate_repair_stronghold(s, a, td),
+    "place_camp": lambda s, a, ud, td, fd, cd, pd: _validate_place_camp(s, a, cd, td),
+    "queue_camp_placement": lambda s, a, ud, td, fd, cd, pd: _validate_queue_camp_placement(s, a, cd, td),
+    "cancel_camp_placement": lambda s, a, ud, td, fd, cd, pd: _validate_cancel_camp_placement(s, a),
+    "end_phase": lambda s, a, ud, td, fd, cd, pd: _validate_end_phase(
+        s, faction_defs=fd, unit_defs=ud, territory_defs=td, camp_defs=cd
+    ),
+    "end_turn": lambda s, a, ud, td, fd, cd, pd: _VALID,
+    "continue_combat": lambda s, a, ud, td, fd, cd, pd: _VALID,
+    "skip_turn": lambda s, a, ud, td, fd, cd, pd: _VALID,
+}
+
+
 def get_available_action_types(state: GameState) -> list[str]:
     """Get action types available in the current phase and combat state."""
     if state.winner is not None:
@@ -1605,9 +1607,9 @@ def get_available_action_types(state: GameState) -> list[str]:
     # Filter based on combat state
     if state.phase == "combat":
         if state.active_combat is not None:
-            allowed = [a for a in allowed if a in ["continue_combat", "retreat", "set_territory_defender_casualty_order"]]
+            allowed = [a for a in allowed if a in _ACTIVE_COMBAT_ACTIONS]
         else:
-            allowed = [a for a in allowed if a not in ["continue_combat", "retreat"]]
+            allowed = [a for a in allowed if a not in _COMBAT_ONLY_ACTIONS]
 
     return allowed
 
@@ -1623,11 +1625,12 @@ def get_movable_units(
     Returns list of {instance_id, unit_id, territory_id, remaining_movement}.
     """
     result = []
+    prefix = faction_id + "_"
 
     for territory_id, territory in state.territories.items():
         for unit in territory.units:
             # Unit belongs to faction if instance_id prefix matches or unit_def.faction matches (e.g. units in neutral with def faction)
-            belongs = unit.instance_id.startswith(faction_id + "_")
+            belongs = unit.instance_id.startswith(prefix)
             if not belongs and unit_defs:
                 unit_faction = get_unit_faction(unit, unit_defs)
                 belongs = unit_faction == faction_id
@@ -1655,19 +1658,23 @@ def get_unit_move_targets(
     unit_defs: dict[str, UnitDefinition],
     territory_defs: dict[str, TerritoryDefinition],
     faction_defs: dict[str, FactionDefinition],
+    cache: dict | None = None,
 ) -> tuple[dict[str, int], dict[str, list[list[str]]]]:
     """
     Get all territories a specific unit can move to.
     Returns (targets_dict, charge_routes).
     - targets_dict: territory_id -> movement_cost
     - charge_routes: for cavalry in combat_move, territory_id -> list of charge_through paths (empty enemy IDs)
+    cache: optional reachability cache shared across calls against the same, unmodified state
+    (see get_reachable_territories_for_unit); results from it must not be mutated.
     """
     for territory_id, territory in state.territories.items():
         for unit in territory.units:
             if unit.instance_id == unit_instance_id:
                 return get_reachable_territories_for_unit(
                     unit, territory_id, state, unit_defs,
-                    territory_defs, faction_defs, state.phase
+                    territory_defs, faction_defs, state.phase,
+                    cache=cache,
                 )
 
     return {}, {}  # Unit not found
@@ -1685,10 +1692,25 @@ def filter_unit_instances_that_can_reach(
     Return only those unit instance IDs that can reach to_territory_id.
     Uses each unit's remaining_movement and phase; never includes a unit that cannot reach.
     """
+    # One pass to locate the units (first occurrence, as get_unit_move_targets), and one
+    # reachability cache so units of the same type and movement at one origin pathfind once.
+    wanted = set(unit_instance_ids)
+    located: dict[str, tuple[Unit, str]] = {}
+    for territory_id, territory in state.territories.items():
+        for unit in territory.units:
+            if unit.instance_id in wanted and unit.instance_id not in located:
+                located[unit.instance_id] = (unit, territory_id)
+    reachable_cache: dict = {}
     result = []
     for iid in unit_instance_ids:
-        targets, _ = get_unit_move_targets(
-            state, iid, unit_defs, territory_defs, faction_defs
+        found = located.get(iid)
+        if not found:
+            continue
+        unit, territory_id = found
+        targets, _ = get_reachable_territories_for_unit(
+            unit, territory_id, state, unit_defs,
+            territory_defs, faction_defs, state.phase,
+            cache=reachable_cache,
         )
         if to_territory_id in (targets or {}):
             result.append(iid)
@@ -1713,15 +1735,15 @@ def get_purchasable_units(
         if not unit_def.purchasable:
             continue
 
-        # Calculate max affordable
-        max_affordable = float('inf')
-        for resource, cost in unit_def.cost.items():
-            available = faction_resources.get(resource, 0)
-            if cost > 0:
-                max_affordable = min(max_affordable, available // cost)
-
-        if max_affordable == float('inf'):
-            max_affordable = 0
+        # Calculate max affordable (0 when the unit has no positive cost)
+        max_affordable = min(
+            (
+                faction_resources.get(resource, 0) // cost
+                for resource, cost in unit_def.cost.items()
+                if cost > 0
+            ),
+            default=0,
+        )
 
         result.append({
             "unit_id": unit_id,
@@ -1755,24 +1777,12 @@ def get_mobilization_territories(
     camp_defs = camp_defs or {}
     port_defs = port_defs or {}
     unit_defs = unit_defs or {}
-    result = []
-    for territory_id, territory in state.territories.items():
-        if territory.owner != faction_id:
-            continue
-        if _territory_has_standing_camp(state, territory_id, camp_defs):
-            result.append(territory_id)
+    owned = [tid for tid, territory in state.territories.items() if territory.owner == faction_id]
+    result = [tid for tid in owned if _territory_has_standing_camp(state, tid, camp_defs)]
     # Home territories: owned, no camp yet in list; include even if territory has a port (home special overrides for that unit)
-    for territory_id, territory in state.territories.items():
-        if territory.owner != faction_id or territory_id in result:
-            continue
-        if _territory_has_standing_camp(state, territory_id, camp_defs):
-            continue
-        for ud in unit_defs.values():
-            if getattr(ud, "faction", None) != faction_id:
-                continue
-            if has_unit_special(ud, "home") and territory_id in _home_territory_ids(ud):
-                result.append(territory_id)
-                break
+    home_units = _home_units_by_territory(faction_id, unit_defs)
+    with_camp = set(result)
+    result.extend(tid for tid in owned if tid not in with_camp and tid in home_units)
     return result
 
 
@@ -1821,21 +1831,16 @@ def get_mobilization_capacity(
     port_territories = []
     total = 0
     seen = set()
-    for territory_id, territory in state.territories.items():
-        if territory.owner != faction_id or territory_id in seen:
-            continue
+    owned = [tid for tid, territory in state.territories.items() if territory.owner == faction_id]
+    home_units_by_territory = _home_units_by_territory(faction_id, unit_defs)
+    for territory_id in owned:
         territory_def = territory_defs.get(territory_id)
         if not territory_def:
             continue
         power = territory_def.produces.get("power", 0)
         if _territory_has_standing_camp(state, territory_id, camp_defs):
             seen.add(territory_id)
-            home_at_camp: dict[str, int] = {}
-            for uid, uud in unit_defs.items():
-                if getattr(uud, "faction", None) != faction_id:
-                    continue
-                if has_unit_special(uud, "home") and territory_id in _home_territory_ids(uud):
-                    home_at_camp[uid] = 1
+            home_at_camp = dict(home_units_by_territory.get(territory_id, {}))
             owned_at_start = getattr(state, "faction_territories_at_turn_start", {}).get(faction_id, []) or []
             camp_power = power if territory_id in owned_at_start else 0
             camp_row: dict[str, Any] = {"territory_id": territory_id, "power": camp_power}
@@ -1846,12 +1851,7 @@ def get_mobilization_capacity(
         elif _territory_has_port(territory_id, port_defs):
             seen.add(territory_id)
             sea_zone_ids = _sea_zones_adjacent_to_port_territory(territory_id, territory_defs)
-            home_on_port: dict[str, int] = {}
-            for unit_id, ud in unit_defs.items():
-                if getattr(ud, "faction", None) != faction_id:
-                    continue
-                if has_unit_special(ud, "home") and territory_id in _home_territory_ids(ud):
-                    home_on_port[unit_id] = 1
+            home_on_port = dict(home_units_by_territory.get(territory_id, {}))
             port_territories.append({
                 "territory_id": territory_id,
                 "power": power,
@@ -1860,17 +1860,12 @@ def get_mobilization_capacity(
             })
             # Ports only mobilize naval to sea zones; do not add to total land capacity
     # Home-only territories: owned, no camp/port; cap 1 per unit type that has this as home
-    for territory_id, territory in state.territories.items():
-        if territory.owner != faction_id or territory_id in seen:
+    for territory_id in owned:
+        if territory_id in seen:
             continue
         if _territory_has_standing_camp(state, territory_id, camp_defs) or _territory_has_port(territory_id, port_defs):
             continue
-        home_units: dict[str, int] = {}
-        for unit_id, ud in unit_defs.items():
-            if getattr(ud, "faction", None) != faction_id:
-                continue
-            if has_unit_special(ud, "home") and territory_id in _home_territory_ids(ud):
-                home_units[unit_id] = 1
+        home_units = dict(home_units_by_territory.get(territory_id, {}))
         if home_units:
             seen.add(territory_id)
             territories.append({
@@ -1904,15 +1899,18 @@ def count_open_home_mobilization_slots_for_unit(
     camp_defs: dict[str, CampDefinition] | None,
     port_defs: dict[str, PortDefinition] | None,
     unit_defs: dict[str, UnitDefinition],
+    capacity: dict[str, Any] | None = None,
 ) -> int:
     """
     Units with home special only deploy to home territories (and port homes). Count how many
     slots remain for this unit_id this mobilization phase after pending_mobilizations.
+    capacity: get_mobilization_capacity() result for the same state and arguments, when the
+    caller already has it (e.g. checking several unit types against an unchanged state).
     """
     ud = unit_defs.get(unit_id)
     if not ud or not has_unit_special(ud, "home") or not _home_territory_ids(ud):
         return 0
-    cap = get_mobilization_capacity(
+    cap = capacity if capacity is not None else get_mobilization_capacity(
         state, faction_id, territory_defs, camp_defs, port_defs, unit_defs
     )
     total = 0
@@ -1953,12 +1951,16 @@ def get_contested_territories(
     Attackers are on that land territory; `sea_zone_id` on an entry (from `territory_sea_raid_from`) is only
     for initiate_combat to know which sea zone held the fleet.
     """
-    attacker_alliance = faction_defs.get(faction_id, FactionDefinition(
-        "", "", "", "", "")).alliance
+    alliance_of = {fid: fd.alliance for fid, fd in faction_defs.items()}
+    attacker_alliance = alliance_of.get(faction_id, "")
 
     result = []
+    sea_raid_from = getattr(state, "territory_sea_raid_from", None) or {}
 
     for territory_id, territory in state.territories.items():
+        # Needs at least one attacker and one defender
+        if len(territory.units) < 2:
+            continue
         attacker_units = []
         defender_units = []
 
@@ -1968,16 +1970,14 @@ def get_contested_territories(
             is_sea = tdef and getattr(tdef, "terrain_type", "").lower() == "sea"
 
         for unit in territory.units:
-            unit_faction = get_unit_faction(unit, unit_defs)
             ud = unit_defs.get(unit.unit_id)
+            unit_faction = ud.faction if ud else None  # as get_unit_faction
             if is_sea and not participates_in_sea_hex_naval_combat(unit, ud):
                 continue
             if unit_faction == faction_id:
                 attacker_units.append(unit)
             elif unit_faction is not None:
-                unit_alliance = faction_defs.get(unit_faction, FactionDefinition(
-                    "", "", "", "", "")).alliance
-                if unit_alliance != attacker_alliance:
+                if alliance_of.get(unit_faction, "") != attacker_alliance:
                     defender_units.append(unit)
 
         if attacker_units and defender_units:
@@ -1988,7 +1988,6 @@ def get_contested_territories(
                 "attacker_unit_ids": [u.instance_id for u in attacker_units],
                 "defender_unit_ids": [u.instance_id for u in defender_units],
             }
-            sea_raid_from = getattr(state, "territory_sea_raid_from", None) or {}
             if territory_id in sea_raid_from:
                 entry["sea_zone_id"] = sea_raid_from[territory_id]
             result.append(entry)
@@ -2116,7 +2115,7 @@ def validate_sail_move_for_offload_sea_raid(
             False,
             f"Too many passengers ({len(passengers)}) for transport capacity ({naval_capacity})",
         )
-    return ValidationResult(True)
+    return _VALID
 
 
 def get_sea_raid_targets(
@@ -2133,7 +2132,8 @@ def get_sea_raid_targets(
     """
     if not territory_defs:
         return []
-    attacker_alliance = faction_defs.get(faction_id, FactionDefinition("", "", "", "", "")).alliance
+    alliance_of = {fid: fd.alliance for fid, fd in faction_defs.items()}
+    attacker_alliance = alliance_of.get(faction_id, "")
     result = []
     for sea_zone_id, territory in state.territories.items():
         tdef = territory_defs.get(sea_zone_id)
@@ -2150,8 +2150,7 @@ def get_sea_raid_targets(
                 else:
                     my_land.append(unit)
             elif uf is not None:
-                other_alliance = faction_defs.get(uf, FactionDefinition("", "", "", "", "")).alliance
-                if other_alliance != attacker_alliance:
+                if alliance_of.get(uf, "") != attacker_alliance:
                     enemy_units = True
                     break
         if enemy_units or not my_naval or not my_land:
@@ -2186,10 +2185,9 @@ def _territory_is_friendly_for_retreat(
     if owner is None:
         return False
 
-    attacker_alliance = faction_defs.get(attacker_faction, FactionDefinition(
-        "", "", "", "", "")).alliance
-    owner_alliance = faction_defs.get(owner, FactionDefinition("", "", "", "", "")).alliance
-    return owner_alliance == attacker_alliance
+    attacker_fd = faction_defs.get(attacker_faction)
+    owner_fd = faction_defs.get(owner)
+    return (owner_fd.alliance if owner_fd else "") == (attacker_fd.alliance if attacker_fd else "")
 
 
 def _get_retreat_adjacent_ids(
@@ -2247,14 +2245,17 @@ def get_retreat_options(
     if getattr(state.active_combat, "sea_zone_id", None):
         return []
 
-    attacker_faction = state.active_combat.attacker_faction
+    # Same rule as _territory_is_friendly_for_retreat (owned, owner in the attacker's alliance),
+    # with the alliance lookups done once for all candidates
+    alliance_of = {fid: fd.alliance for fid, fd in faction_defs.items()}
+    attacker_alliance = alliance_of.get(state.active_combat.attacker_faction, "")
     result = []
     retreat_adjacent = _get_retreat_adjacent_ids(state, territory_defs, unit_defs)
     for adj_id in retreat_adjacent:
         adj_territory = state.territories.get(adj_id)
-        if not adj_territory:
+        if not adj_territory or adj_territory.owner is None:
             continue
-        if _territory_is_friendly_for_retreat(adj_territory, attacker_faction, faction_defs, unit_defs):
+        if alliance_of.get(adj_territory.owner, "") == attacker_alliance:
             result.append(adj_id)
 
     return result
@@ -2308,42 +2309,46 @@ def get_faction_stats(
     unit_power = sum of power cost for all active units for that faction.
     """
     unit_defs = unit_defs or {}
-    factions: dict[str, dict[str, int]] = {}
-    for faction_id in faction_defs:
-        territories_count = 0
-        strongholds_count = 0
-        power_per_turn = 0
-        for tid, ts in state.territories.items():
-            if ts.owner != faction_id:
-                continue
-            territories_count += 1
-            tdef = territory_defs.get(tid)
-            if tdef and getattr(tdef, "is_stronghold", False):
-                strongholds_count += 1
-            if tdef and hasattr(tdef, "produces") and isinstance(tdef.produces, dict):
-                power_per_turn += tdef.produces.get("power", 0)
-        power = state.faction_resources.get(faction_id, {}).get("power", 0)
-        factions[faction_id] = {
-            "territories": territories_count,
-            "strongholds": strongholds_count,
-            "power": power,
-            "power_per_turn": power_per_turn,
+    factions: dict[str, dict[str, int]] = {
+        faction_id: {
+            "territories": 0,
+            "strongholds": 0,
+            "power": state.faction_resources.get(faction_id, {}).get("power", 0),
+            "power_per_turn": 0,
             "units": 0,
             "unit_power": 0,
         }
+        for faction_id in faction_defs
+    }
+    # Strongholds with no owner (e.g. Moria at start) for UI bar: good | neutral | evil
+    neutral_strongholds = 0
 
-    # Count units and unit_power by unit's faction (so sea units in sea zones are included)
+    # One pass: territory counts by owner, plus units and unit_power by unit's faction
+    # (so sea units in sea zones are included)
     for tid, ts in state.territories.items():
+        tdef = territory_defs.get(tid)
+        owner = ts.owner
+        if owner is None:
+            if tdef and getattr(tdef, "is_stronghold", False):
+                neutral_strongholds += 1
+        else:
+            owner_stats = factions.get(owner)
+            if owner_stats is not None:
+                owner_stats["territories"] += 1
+                if tdef and getattr(tdef, "is_stronghold", False):
+                    owner_stats["strongholds"] += 1
+                if tdef and hasattr(tdef, "produces") and isinstance(tdef.produces, dict):
+                    owner_stats["power_per_turn"] += tdef.produces.get("power", 0)
         for unit in ts.units:
             ud = unit_defs.get(unit.unit_id)
             if not ud:
                 continue
-            fid = getattr(ud, "faction", None)
-            if fid not in factions:
+            unit_stats = factions.get(getattr(ud, "faction", None))
+            if unit_stats is None:
                 continue
-            factions[fid]["units"] += 1
+            unit_stats["units"] += 1
             if isinstance(getattr(ud, "cost", None), dict):
-                factions[fid]["unit_power"] += ud.cost.get("power", 0)
+                unit_stats["unit_power"] += ud.cost.get("power", 0)
 
     alliances: dict[str, dict[str, int]] = {}
     for faction_id, fd in faction_defs.items():
@@ -2358,15 +2363,6 @@ def get_faction_stats(
         alliances[alliance]["units"] += st.get("units", 0)
         alliances[alliance]["unit_power"] += st.get("unit_power", 0)
 
-    # Strongholds with no owner (e.g. Moria at start) for UI bar: good | neutral | evil
-    neutral_strongholds = 0
-    for tid, ts in state.territories.items():
-        if ts.owner is not None:
-            continue
-        tdef = territory_defs.get(tid)
-        if tdef and getattr(tdef, "is_stronghold", False):
-            neutral_strongholds += 1
-
     out: dict[str, Any] = {
         "factions": factions,
         "alliances": alliances,
@@ -2445,25 +2441,20 @@ def get_game_summary(
     """
     Get a summary of the current game state for UI display.
     """
-    # Count strongholds per alliance
+    # One pass: strongholds per alliance, territories per faction, units per faction
     stronghold_counts: dict[str, int] = {}
-    for tid, ts in state.territories.items():
-        td = territory_defs.get(tid)
-        if td and td.is_stronghold and ts.owner:
-            fd = faction_defs.get(ts.owner)
-            if fd:
-                alliance = fd.alliance
-                stronghold_counts[alliance] = stronghold_counts.get(alliance, 0) + 1
-
-    # Count territories per faction
     territory_counts: dict[str, int] = {}
-    for ts in state.territories.values():
-        if ts.owner:
-            territory_counts[ts.owner] = territory_counts.get(ts.owner, 0) + 1
-
-    # Count units per faction
     unit_counts: dict[str, int] = {}
-    for ts in state.territories.values():
+    for tid, ts in state.territories.items():
+        owner = ts.owner
+        if owner:
+            territory_counts[owner] = territory_counts.get(owner, 0) + 1
+            td = territory_defs.get(tid)
+            if td and td.is_stronghold:
+                fd = faction_defs.get(owner)
+                if fd:
+                    alliance = fd.alliance
+                    stronghold_counts[alliance] = stronghold_counts.get(alliance, 0) + 1
         for unit in ts.units:
             faction = get_unit_faction(unit, unit_defs)
             if faction:
@@ -2518,12 +2509,13 @@ def get_territory_unit_stacks(
                 continue
 
         unit_type = unit.unit_id
-        if unit_type not in stacks:
+        stack = stacks.get(unit_type)
+        if stack is None:
             display_name = unit_type
             if unit_defs and unit_type in unit_defs:
                 display_name = unit_defs[unit_type].display_name
 
-            stacks[unit_type] = {
+            stack = stacks[unit_type] = {
                 "unit_id": unit_type,
                 "display_name": display_name,
                 "count": 0,
@@ -2532,12 +2524,14 @@ def get_territory_unit_stacks(
                 "movable_instance_ids": [],
             }
 
-        stacks[unit_type]["count"] += 1
-        stacks[unit_type]["instance_ids"].append(unit.instance_id)
-
+        stack["instance_ids"].append(unit.instance_id)
         if unit.remaining_movement > 0:
-            stacks[unit_type]["can_move_count"] += 1
-            stacks[unit_type]["movable_instance_ids"].append(unit.instance_id)
+            stack["movable_instance_ids"].append(unit.instance_id)
+
+    # Counts are the list lengths; filled once per stack rather than incremented per unit
+    for stack in stacks.values():
+        stack["count"] = len(stack["instance_ids"])
+        stack["can_move_count"] = len(stack["movable_instance_ids"])
 
     return list(stacks.values())
 
@@ -2550,6 +2544,7 @@ def get_stack_move_targets(
     territory_defs: dict[str, TerritoryDefinition],
     faction_defs: dict[str, FactionDefinition],
     max_units: int | None = None,
+    cache: dict | None = None,
 ) -> dict[str, dict[str, Any]]:
     """
     Get move targets for a stack of units of the same type.
@@ -2571,6 +2566,8 @@ def get_stack_move_targets(
         territory_defs: Territory definitions
         faction_defs: Faction definitions
         max_units: Optional limit on units to consider
+        cache: Optional reachability cache shared across calls against the same,
+            unmodified state (see get_reachable_territories_for_unit)
 
     Returns:
         Dict of {destination_id: {
@@ -2596,16 +2593,19 @@ def get_stack_move_targets(
     if not movable_units:
         return {}
 
-    # Build map of unit -> remaining_movement for sorting
-    unit_mobility = {u.instance_id: u.remaining_movement for u in movable_units}
-
     # Get destinations for each unit (union of all reachable)
     destinations: dict[str, dict] = {}
+    # Units with equal remaining_movement get the same result, so the search runs once per
+    # distinct movement value. Fewer moves do not simply give a subset of the most mobile unit's
+    # destinations with cost <= movement: aerial units must keep enough movement to land, and a
+    # boat's sea-zone destinations depend on its own load slots.
+    reachable_cache: dict = cache if cache is not None else {}
 
     for unit in movable_units:
         targets, _ = get_reachable_territories_for_unit(
             unit, territory_id, state, unit_defs,
-            territory_defs, faction_defs, state.phase
+            territory_defs, faction_defs, state.phase,
+            cache=reachable_cache,
         )
 
         for dest_id, cost in targets.items():
@@ -2618,15 +2618,9 @@ def get_stack_move_targets(
                     "instance_ids": [],
                 }
             destinations[dest_id]["max_units"] += 1
+            # movable_units is already most-mobile first, so appending keeps that order
             destinations[dest_id]["instance_ids"].append(unit.instance_id)
 
-    # Sort instance_ids in each destination by mobility (most mobile first)
-    for dest_info in destinations.values():
-        dest_info["instance_ids"].sort(
-            key=lambda iid: unit_mobility.get(iid, 0),
-            reverse=True
-        )
-
     return destinations
 
 
@@ -2672,14 +2666,23 @@ def get_move_preview(
     current_faction_def = faction_defs.get(faction_id)
     if current_faction_def:
         current_alliance = current_faction_def.alliance
+    # Owners that count as enemy for is_enemy; unknown owners never do
+    enemy_factions = frozenset(
+        fid for fid, fd in faction_defs.items()
+        if fid != faction_id and fd.alliance != current_alliance
+    )
 
     stacks = get_territory_unit_stacks(state, territory_id, faction_id, unit_defs)
+    # Stacks share the origin, phase and faction, so territory classification and neighbor
+    # steps computed for one stack are reused by the rest.
+    reachable_cache: dict = {}
 
     for stack in stacks:
         # Get destinations for this stack
         raw_destinations = get_stack_move_targets(
             state, territory_id, stack["unit_id"],
-            unit_defs, territory_defs, faction_defs
+            unit_defs, territory_defs, faction_defs,
+            cache=reachable_cache,
         )
 
         # Add is_enemy flag and filter for combat_move phase
@@ -2694,19 +2697,13 @@ def get_move_preview(
                 else None
             )
 
-            is_enemy = False
-            if dest_owner and dest_owner != faction_id:
-                dest_faction_def = faction_defs.get(dest_owner)
-                if dest_faction_def and dest_faction_def.alliance != current_alliance:
-                    is_enemy = True
+            is_enemy = dest_owner in enemy_factions
 
             # Phase-based filtering
             if state.phase == "combat_move":
                 # Only show enemy/neutral territories
-                if dest_owner and dest_owner == faction_id:
-                    continue  # Skip friendly territories
                 if dest_owner and not is_enemy:
-                    continue  # Skip allied territories
+                    continue  # Skip friendly and allied territories
             elif state.phase == "non_combat_move":
                 # Only show friendly/allied/neutral territories
                 if is_enemy:
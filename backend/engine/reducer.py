@@ -17,6 +17,7 @@ from backend.engine.combat import (
     get_siegework_round_attacker_display_units,
     get_siegework_round_defender_display_units,
     SIEGEWORK_SPECIAL_LADDER,
+    clone_unit,
     resolve_combat_round,
     resolve_archer_prefire,
     resolve_stealth_prefire,
@@ -328,6 +329,8 @@ PHASE_ALLOWED_ACTIONS = {
     "non_combat_move": ["move_units", "cancel_move", SET_TERRITORY_DEFENDER_CASUALTY_ORDER, "end_phase", "skip_turn"],
     "mobilization": ["mobilize_units", "queue_camp_placement", "cancel_camp_placement", "cancel_mobilization", SET_TERRITORY_DEFENDER_CASUALTY_ORDER, "end_phase", "end_turn", "skip_turn"],
 }
+# Same rules as frozensets, for membership checks
+_PHASE_ALLOWED_ACTION_SETS = {phase: frozenset(actions) for phase, actions in PHASE_ALLOWED_ACTIONS.items()}
 
 
 def _validate_action_for_phase(action: Action, state: GameState) -> None:
@@ -339,13 +342,13 @@ def _validate_action_for_phase(action: Action, state: GameState) -> None:
     - If no active_combat: only initiate_combat and end_phase allowed
     """
     phase = state.phase
-    allowed_actions = PHASE_ALLOWED_ACTIONS.get(phase, [])
 
     action_type_attr = getattr(action, "type", None) or getattr(action, "action_type", None)
     if action_type_attr is None and isinstance(action, dict):
         action_type_attr = action.get("type") or action.get("action_type")
     action_type_attr = str(action_type_attr or "").strip()
-    if action_type_attr not in allowed_actions:
+    if action_type_attr not in _PHASE_ALLOWED_ACTION_SETS.get(phase, ()):
+        allowed_actions = PHASE_ALLOWED_ACTIONS.get(phase, [])
         raise ValueError(
             f"Action '{action_type_attr}' is not allowed in phase '{phase}'. "
             f"Allowed actions: {', '.join(allowed_actions)}"
@@ -368,6 +371,29 @@ def _validate_action_for_phase(action: Action, state: GameState) -> None:
                 )
 
 
+# Action type -> handler(state, action, unit_defs, territory_defs, faction_defs, camp_defs, port_defs).
+# One dict lookup per action instead of an if/elif chain of string compares.
+_ACTION_HANDLERS = {
+    SET_TERRITORY_DEFENDER_CASUALTY_ORDER: lambda s, a, ud, td, fd, cd, pd: _handle_set_territory_defender_casualty_order(s, a),
+    "purchase_camp": lambda s, a, ud, td, fd, cd, pd: _handle_purchase_camp(s, a, cd or {}, td),
+    "repair_stronghold": lambda s, a, ud, td, fd, cd, pd: _handle_repair_stronghold(s, a, td),
+    "place_camp": lambda s, a, ud, td, fd, cd, pd: _handle_place_camp(s, a, cd or {}),
+    "queue_camp_placement": lambda s, a, ud, td, fd, cd, pd: _handle_queue_camp_placement(s, a, cd or {}),
+    "cancel_camp_placement": lambda s, a, ud, td, fd, cd, pd: _handle_cancel_camp_placement(s, a),
+    "purchase_units": lambda s, a, ud, td, fd, cd, pd: _handle_purchase_units(s, a, ud, fd, td, cd or {}, pd or {}),
+    "move_units": lambda s, a, ud, td, fd, cd, pd: _handle_move_units(s, a, ud, td, fd),
+    "initiate_combat": lambda s, a, ud, td, fd, cd, pd: _handle_initiate_combat(s, a, ud, td, fd),
+    "continue_combat": lambda s, a, ud, td, fd, cd, pd: _handle_continue_combat(s, a, ud, td, fd),
+    "retreat": lambda s, a, ud, td, fd, cd, pd: _handle_retreat(s, a, ud, td, fd),
+    "mobilize_units": lambda s, a, ud, td, fd, cd, pd: _handle_mobilize_units(s, a, ud, td, fd, cd, pd),
+    "cancel_move": lambda s, a, ud, td, fd, cd, pd: _handle_cancel_move(s, a),
+    "cancel_mobilization": lambda s, a, ud, td, fd, cd, pd: _handle_cancel_mobilization(s, a),
+    "end_phase": lambda s, a, ud, td, fd, cd, pd: _handle_end_phase(s, ud, td, fd, cd),
+    "end_turn": lambda s, a, ud, td, fd, cd, pd: _handle_end_turn(s, td, fd, cd, ud),
+    "skip_turn": lambda s, a, ud, td, fd, cd, pd: _handle_skip_turn(s, ud, td, fd, cd),
+}
+
+
 def apply_action(
     state: GameState,
     action: Action,
@@ -419,93 +445,15 @@ def apply_action(
         _raw = action.get("type") or action.get("action_type")
     action_type = (str(_raw) if _raw is not None else "").strip()
 
-    # Handle defender casualty order first so it can never raise "Unknown action type"
-    if (action_type == SET_TERRITORY_DEFENDER_CASUALTY_ORDER or
-            (action_type and "set_territory_defender_casualty_order" in action_type) or
-            (action_type and "defender_casualty" in action_type)):
-        new_state, evts = _handle_set_territory_defender_casualty_order(new_state, action)
-        events.extend(evts)
-
-    elif action_type == "purchase_camp":
-        new_state, evts = _handle_purchase_camp(
-            new_state, action, camp_defs or {}, territory_defs)
-        events.extend(evts)
-
-    elif action_type == "repair_stronghold":
-        new_state, evts = _handle_repair_stronghold(new_state, action, territory_defs)
-        events.extend(evts)
-
-    elif action_type == "place_camp":
-        new_state, evts = _handle_place_camp(new_state, action, camp_defs or {})
-        events.extend(evts)
-
-    elif action_type == "queue_camp_placement":
-        new_state, evts = _handle_queue_camp_placement(new_state, action, camp_defs or {})
-        events.extend(evts)
-
-    elif action_type == "cancel_camp_placement":
-        new_state, evts = _handle_cancel_camp_placement(new_state, action)
-        events.extend(evts)
-
-    elif action_type == "purchase_units":
-        new_state, evts = _handle_purchase_units(
-            new_state, action, unit_defs, faction_defs,
-            territory_defs, camp_defs or {}, port_defs or {})
-        events.extend(evts)
-
-    elif action_type == "move_units":
-        new_state, evts = _handle_move_units(
-            new_state, action, unit_defs, territory_defs, faction_defs)
-        events.extend(evts)
-
-    elif action_type == "initiate_combat":
-        new_state, evts = _handle_initiate_combat(
-            new_state, action, unit_defs, territory_defs, faction_defs)
-        events.extend(evts)
-
-    elif action_type == "continue_combat":
-        new_state, evts = _handle_continue_combat(
-            new_state, action, unit_defs, territory_defs, faction_defs)
-        events.extend(evts)
-
-    elif action_type == "retreat":
-        new_state, evts = _handle_retreat(new_state, action, unit_defs, territory_defs, faction_defs)
-        events.extend(evts)
-
-    elif action_type == "mobilize_units":
-        new_state, evts = _handle_mobilize_units(
-            new_state, action, unit_defs, territory_defs, faction_defs, camp_defs, port_defs)
-        events.extend(evts)
-
-    elif action_type == "cancel_move":
-        new_state, evts = _handle_cancel_move(new_state, action)
-        events.extend(evts)
-
-    elif action_type == "cancel_mobilization":
-        new_state, evts = _handle_cancel_mobilization(new_state, action)
-        events.extend(evts)
-
-    elif action_type == "end_phase":
-        new_state, evts = _handle_end_phase(
-            new_state, unit_defs, territory_defs, faction_defs, camp_defs)
-        events.extend(evts)
-
-    elif action_type == "end_turn":
-        new_state, evts = _handle_end_turn(
-            new_state, territory_defs, faction_defs, camp_defs, unit_defs)
-        events.extend(evts)
-
-    elif action_type == "skip_turn":
-        new_state, evts = _handle_skip_turn(
-            new_state, unit_defs, territory_defs, faction_defs, camp_defs)
-        events.extend(evts)
-
-    else:
-        if SET_TERRITORY_DEFENDER_CASUALTY_ORDER in (action_type or "") or "defender_casualty" in (action_type or ""):
-            new_state, evts = _handle_set_territory_defender_casualty_order(new_state, action)
-            events.extend(evts)
-        else:
-            raise ValueError(f"Unknown action type: {action_type or getattr(action, 'type', '?')}")
+    handler = _ACTION_HANDLERS.get(action_type)
+    if handler is None and action_type and "defender_casualty" in action_type:
+        # Tolerate variants of the defender casualty order type so it never raises "Unknown action type"
+        handler = _ACTION_HANDLERS[SET_TERRITORY_DEFENDER_CASUALTY_ORDER]
+    if handler is None:
+        raise ValueError(f"Unknown action type: {action_type or getattr(action, 'type', '?')}")
+    new_state, evts = handler(
+        new_state, action, unit_defs, territory_defs, faction_defs, camp_defs, port_defs)
+    events.extend(evts)
 
     # Enrich every event with turn_number, phase, faction, and human-readable message
     for e in events:
@@ -1002,7 +950,7 @@ def _handle_move_units(
         units_by_id[unit.instance_id] = unit
 
     charge_through = action.payload.get("charge_through")
-    if charge_through is not None and not isinstance(charge_through, list):
+    if charge_through is not None and not isinstance(charge_through, (list, tuple)):
         charge_through = []
     charge_through = [str(t) for t in charge_through if str(t) != to_id] if charge_through else []
     # Destination must never be in charge_through (we only pass through; destination can have units)
@@ -1029,6 +977,8 @@ def _handle_move_units(
         has_unit_special(unit_defs.get(u.unit_id), "ford_crosser") for u in units_to_move
     )
     if not sea_offload_ok:
+        # Same state and ford arguments for the whole stack: same-type units pathfind once
+        reachable_cache: dict = {}
         for unit in units_to_move:
             reachable, charge_routes = get_reachable_territories_for_unit(
                 unit,
@@ -1041,6 +991,7 @@ def _handle_move_units(
                 None,
                 ford_pending_exclude,
                 same_move_has_ford_crosser,
+                reachable_cache,
             )
             all_charge_routes.append(charge_routes)
             can_reach_list.append(to_id in reachable)
@@ -2310,14 +2261,14 @@ def _handle_initiate_combat(
         # Sea raid: only land units (passengers) fight; boats stay in sea zone. Naval units cannot attack land.
         # After phase end, land units may already be on territory (offloaded); use them then.
         attacker_units = [
-            deepcopy(u) for u in sea_zone.units
+            clone_unit(u) for u in sea_zone.units
             if get_unit_faction(u, unit_defs) == attacker_faction
             and is_land_unit(unit_defs.get(u.unit_id))
             and not _is_naval_unit(unit_defs.get(u.unit_id))
         ]
         if not attacker_units:
             attacker_units = [
-                deepcopy(u) for u in territory.units
+                clone_unit(u) for u in territory.units
                 if get_unit_faction(u, unit_defs) == attacker_faction
                 and is_land_unit(unit_defs.get(u.unit_id))
                 and not _is_naval_unit(unit_defs.get(u.unit_id))
@@ -2325,7 +2276,7 @@ def _handle_initiate_combat(
             if attacker_units:
                 attacker_territory = territory  # Attackers already offloaded to land
         defender_units = [
-            deepcopy(u) for u in territory.units
+            clone_unit(u) for u in territory.units
             if _land_combat_unit_side(u, attacker_faction, attacker_alliance, unit_defs, faction_defs) == "defender"
         ]
         attacker_units.sort(key=lambda u: u.instance_id)
@@ -2369,9 +2320,9 @@ def _handle_initiate_combat(
                 unit, attacker_faction, attacker_alliance, unit_defs, faction_defs,
             )
             if side == "attacker":
-                attacker_units.append(deepcopy(unit))
+                attacker_units.append(clone_unit(unit))
             elif side == "defender":
-                defender_units.append(deepcopy(unit))
+                defender_units.append(clone_unit(unit))
         attacker_units.sort(key=lambda u: u.instance_id)
         defender_units.sort(key=lambda u: u.instance_id)
         if len(attacker_units) == 0:
@@ -3183,7 +3134,7 @@ def _handle_continue_combat(
     attacker_alliance = getattr(faction_defs.get(attacker_faction), "alliance", None)
     attacker_units = sorted(
         [
-            deepcopy(u) for u in attacker_territory.units
+            clone_unit(u) for u in attacker_territory.units
             if u.instance_id in surviving_attacker_ids
             and _land_combat_unit_side(u, attacker_faction, attacker_alliance, unit_defs, faction_defs) == "attacker"
         ],
@@ -3191,7 +3142,7 @@ def _handle_continue_combat(
     )
     defender_units = sorted(
         [
-            deepcopy(u) for u in territory.units
+            clone_unit(u) for u in territory.units
             if _land_combat_unit_side(u, attacker_faction, attacker_alliance, unit_defs, faction_defs) == "defender"
         ],
         key=lambda u: u.instance_id,
@@ -4383,10 +4334,11 @@ def _reset_unit_stats_for_faction(
     back. Only called when ending non_combat_move phase — never during or
     between combat rounds.
     """
+    prefix = faction_id + "_"
     for territory in state.territories.values():
         for unit in territory.units:
             unit_faction = get_unit_faction(unit, unit_defs)
-            if unit_faction is None and unit.instance_id.startswith(faction_id + "_"):
+            if unit_faction is None and unit.instance_id.startswith(prefix):
                 unit_faction = faction_id
             if unit_faction == faction_id:
                 unit.remaining_movement = unit.base_movement
@@ -5,6 +5,7 @@ Includes JSON serialization for save/load functionality.
 """
 
 import json
+import sys
 from dataclasses import dataclass, field
 from copy import deepcopy
 from typing import Any
@@ -66,9 +67,9 @@ def _ensure_victory_criteria(value: Any) -> dict[str, Any]:
     return default
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
-    """Individual unit instance with movement and health tracking."""
+    """Individual unit instance with movement and health tracking. Slotted: no per-instance __dict__."""
     instance_id: str  # Unique ID for this unit instance (e.g., "gondor_infantry_001")
     unit_id: str  # Type of unit (e.g., "gondor_infantry")
     remaining_movement: int  # Movement available this turn
@@ -120,7 +121,9 @@ class Unit:
             loaded_onto = None
         return cls(
             instance_id=str(data.get("instance_id") or ""),
-            unit_id=str(data.get("unit_id") or ""),
+            # Interned: a saved game repeats each unit type id across hundreds of units, and
+            # unit_defs keys are interned too, so unit_defs[unit.unit_id] matches by identity.
+            unit_id=sys.intern(str(data.get("unit_id") or "")),
             remaining_movement=_int(data.get("remaining_movement"), 0),
             remaining_health=remaining_health,
             base_movement=_int(data.get("base_movement"), 0),
@@ -501,7 +501,7 @@ def generate_dice_rolls_for_units(
         random.seed(seed)
 
     skip = exclude_archetypes or set()
-    rolls = []
+    total_dice = 0
     for unit in units:
         unit_def = unit_defs.get(unit.unit_id)
         if unit_def and getattr(unit_def, "archetype", "") in skip:
@@ -511,9 +511,12 @@ def generate_dice_rolls_for_units(
             if effective_dice_override is not None
             else (getattr(unit_def, "dice", 1) if unit_def else 1)
         )
-        for _ in range(dice_count):
-            rolls.append(random.randint(1, DICE_SIDES))
-    return rolls
+        if dice_count > 0:
+            total_dice += dice_count
+    # Rolls are not tied to a unit until they are consumed, so draw them all in one batch
+    # (same random.randint sequence as rolling unit by unit, so seeded results are unchanged).
+    randint = random.randint
+    return [randint(1, DICE_SIDES) for _ in range(total_dice)]
 
 
 def generate_combat_rolls_for_units(
@@ -21,6 +21,7 @@ from backend.engine.definitions import (
     load_setup as load_setup_from_files,
     load_specials as load_specials_from_files,
     load_static_definitions as load_static_definitions_from_files,
+    load_static_definitions_lazy as load_static_definitions_lazy_from_files,
     list_setups as list_setups_from_files,
     parse_prefire_penalty_from_manifest,
     scenario_display_from_setup_id as scenario_display_from_files,
@@ -119,18 +120,35 @@ def _row_to_parsed(row: Setup) -> dict[str, Any]:
     }
 
 
+# setup id -> (manifest_json text, parsed manifest). Menu, detail and meta lookups read the same
+# manifest back to back; a row's text changes on every write, so a text mismatch re-parses.
+_manifest_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+
+
+def _row_manifest(row: Setup) -> dict[str, Any]:
+    """Parsed manifest_json of a setup row, shared between calls: read from it, never mutate it.
+    Raises json.JSONDecodeError like json.loads."""
+    text = row.manifest_json
+    cached = _manifest_cache.get(row.id)
+    if cached is not None and cached[0] == text:
+        return cached[1]
+    m = json.loads(text)
+    _manifest_cache[row.id] = (text, m)
+    return m
+
+
 def load_setup_dict_from_db(db: Session, setup_id: str) -> dict[str, Any] | None:
     """Same shape as engine.definitions.load_setup (id, display_name, map_asset, starting_setup, manifest extras)."""
     row = db.query(Setup).filter(Setup.id == setup_id).first()
     if not row:
         return None
-    p = _row_to_parsed(row)
-    m = p["manifest"]
+    # Only the two columns this needs (not the full _row_to_parsed bundle)
+    m = _row_manifest(row)
     result: dict[str, Any] = {
         "id": m.get("id", setup_id),
         "display_name": m.get("display_name", setup_id),
         "map_asset": m.get("map_asset", setup_id),
-        "starting_setup": p["starting_setup"],
+        "starting_setup": json.loads(row.starting_setup_json),
     }
     vc = m.get("victory_criteria")
     if isinstance(vc, dict) and vc:
@@ -147,19 +165,50 @@ def load_setup_dict_from_db(db: Session, setup_id: str) -> dict[str, Any] | None
     return result
 
 
+# setup id -> (definition column texts, built definitions). Every game created from an unchanged
+# setup gets the same definition objects; a write changes a column's text and forces a rebuild.
+# The engine and API only read definitions, so shared objects are safe as long as that holds.
+_definitions_cache: dict[str, tuple[tuple[str, ...], tuple]] = {}
+
+
+def _row_definitions(row: Setup):
+    """(units, territories, factions, camps, ports) built from a setup row, via _definitions_cache."""
+    texts = (row.units_json, row.territories_json, row.factions_json, row.camps_json, row.ports_json)
+    cached = _definitions_cache.get(row.id)
+    if cached is not None and cached[0] == texts:
+        return cached[1]
+    snap = {
+        "units": json.loads(row.units_json),
+        "territories": json.loads(row.territories_json),
+        "factions": json.loads(row.factions_json),
+        "camps": json.loads(row.camps_json),
+        "ports": json.loads(row.ports_json),
+    }
+    defs = definitions_from_snapshot(snap)
+    _definitions_cache[row.id] = (texts, defs)
+    return defs
+
+
 def load_static_definitions_from_db(db: Session, setup_id: str):
     row = db.query(Setup).filter(Setup.id == setup_id).first()
     if not row:
         return None
-    p = _row_to_parsed(row)
-    snap = {
-        "units": p["units"],
-        "territories": p["territories"],
-        "factions": p["factions"],
-        "camps": p["camps"],
-        "ports": p["ports"],
-    }
-    return definitions_from_snapshot(snap)
+    return _row_definitions(row)
+
+
+def preload_setups_from_db(db: Session) -> int:
+    """Build definitions and parse manifests for every setup in one query (server startup), so the
+    first create-game / menu request for any setup is served from the caches. Returns rows loaded;
+    a row with invalid JSON is skipped and left to fail on its own request as before."""
+    n = 0
+    for row in db.query(Setup).all():
+        try:
+            _row_manifest(row)
+            _row_definitions(row)
+        except (ValueError, KeyError, TypeError, AttributeError):  # JSONDecodeError is a ValueError
+            continue
+        n += 1
+    return n
 
 
 def load_specials_from_db(db: Session, setup_id: str) -> tuple[dict[str, dict], list[str]] | None:
@@ -193,7 +242,7 @@ def list_setups_menu_from_db(db: Session) -> list[dict[str, Any]]:
     out: list[dict[str, Any]] = []
     for row in db.query(Setup).order_by(Setup.id).all():
         try:
-            m = json.loads(row.manifest_json)
+            m = _row_manifest(row)
         except json.JSONDecodeError:
             continue
         if m.get("is_active") is not True:
@@ -217,7 +266,7 @@ def list_all_setups_admin(db: Session) -> list[dict[str, Any]]:
     out = []
     for row in rows:
         try:
-            m = json.loads(row.manifest_json)
+            m = _row_manifest(row)
         except json.JSONDecodeError:
             m = {}
         out.append(
@@ -236,7 +285,7 @@ def scenario_display_from_setup_id_db(db: Session, setup_id: str) -> dict[str, A
     if not row:
         return None
     try:
-        m = json.loads(row.manifest_json)
+        m = _row_manifest(row)
     except json.JSONDecodeError:
         return None
     ctx = m.get("context")
@@ -396,6 +445,15 @@ def try_load_static_definitions(setup_id: str, db: Session | None):
     return load_static_definitions_from_files(setup_id=setup_id)
 
 
+def try_load_combat_definitions(setup_id: str, db: Session | None):
+    """(unit_defs, territory_defs) for combat simulation; from files, only units.json and territories.json are read."""
+    if db is not None and db_has_any_setup(db):
+        ud, td, *_ = try_load_static_definitions(setup_id, db)
+        return ud, td
+    defs = load_static_definitions_lazy_from_files(setup_id=setup_id)
+    return defs.units, defs.territories
+
+
 def try_load_specials(setup_id: str, db: Session | None):
     if db is not None and db_has_any_setup(db):
         hit = load_specials_from_db(db, setup_id)
@@ -0,0 +1,38 @@
+"""Tests for _apply_hits casualty assignment: targets, survivors and their order."""
+import pytest
+from backend.engine.combat import _apply_hits
+from backend.engine.definitions import load_static_definitions
+from backend.engine.state import Unit
+
+
+@pytest.fixture
+def unit_defs():
+    return load_static_definitions(setup_id="wotr_exp_1.0")[0]
+
+
+def _u(instance_id: str, unit_id: str, unit_defs, health: int | None = None) -> Unit:
+    d = unit_defs[unit_id]
+    return Unit(
+        instance_id=instance_id,
+        unit_id=unit_id,
+        remaining_movement=d.movement,
+        remaining_health=d.health if health is None else health,
+        base_movement=d.movement,
+        base_health=d.health,
+    )
+
+
+def test_zero_health_units_stay_in_survivors(unit_defs):
+    units = [_u("z", "gondor_soldier", unit_defs, health=0), _u("a", "armored_troll", unit_defs)]
+    destroyed, wounded = _apply_hits(units, 1, unit_defs, is_attacker=False)
+    assert destroyed == []
+    assert wounded == ["a"]
+    assert [(u.instance_id, u.remaining_health) for u in units] == [("a", 1), ("z", 0)]
+
+
+def test_only_zero_health_units_take_hits_without_dying(unit_defs):
+    units = [_u("z", "gondor_soldier", unit_defs, health=0), _u("y", "gondor_soldier", unit_defs, health=0)]
+    destroyed, wounded = _apply_hits(units, 2, unit_defs, is_attacker=False)
+    assert destroyed == []
+    assert sorted(wounded) == ["y", "z"]
+    assert [(u.instance_id, u.remaining_health) for u in units] == [("z", -1), ("y", -1)]
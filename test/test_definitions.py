@@ -0,0 +1,78 @@
+"""Tests for definition loading and snapshot serialization."""
+import json
+import os
+import shutil
+from dataclasses import asdict
+
+import pytest
+
+from backend.config import DEFAULT_SETUP_ID
+from backend.engine import definitions
+from backend.engine.definitions import (
+    clear_setup_cache,
+    definitions_from_snapshot,
+    definitions_to_dicts,
+    load_static_definitions,
+    load_static_definitions_lazy,
+    read_setup_manifest,
+)
+
+
+def test_definitions_to_dicts_matches_asdict_and_round_trips():
+    defs = load_static_definitions(setup_id=DEFAULT_SETUP_ID)
+    snapshot = {}
+    for key, defs_map in zip(("units", "territories", "factions", "camps", "ports"), defs):
+        dicts = definitions_to_dicts(defs_map)
+        as_dict = asdict if key in ("units", "territories", "factions") else lambda v: v._asdict()
+        expected = {k: as_dict(v) for k, v in defs_map.items()}
+        if key == "units":
+            # Derived fields (init=False) stay out of snapshots
+            for row in expected.values():
+                del row["total_cost"]
+        assert dicts == expected
+        snapshot[key] = dicts
+    assert definitions_from_snapshot(snapshot) == defs
+
+
+def test_definitions_to_dicts_copies_containers():
+    unit_defs = load_static_definitions(setup_id=DEFAULT_SETUP_ID)[0]
+    unit_id, ud = next(iter(unit_defs.items()))
+    dicts = definitions_to_dicts(unit_defs)
+    dicts[unit_id]["tags"].append("mutated")
+    dicts[unit_id]["cost"]["mutated"] = 1
+    assert "mutated" not in ud.tags
+    assert "mutated" not in ud.cost
+
+
+def test_setup_json_cache_tracks_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(definitions, "SETUPS_DIR", tmp_path)
+    manifest = tmp_path / "cache_test" / "manifest.json"
+    manifest.parent.mkdir()
+    manifest.write_text(json.dumps({"display_name": "A"}))
+    assert read_setup_manifest("cache_test") == {"display_name": "A"}
+
+    # Same size and mtime: the cached parse is reused until the cache is cleared
+    stat = manifest.stat()
+    manifest.write_text(json.dumps({"display_name": "B"}))
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert read_setup_manifest("cache_test") == {"display_name": "A"}
+    clear_setup_cache()
+    assert read_setup_manifest("cache_test") == {"display_name": "B"}
+
+    # A changed mtime is picked up without clearing
+    manifest.write_text(json.dumps({"display_name": "C"}))
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert read_setup_manifest("cache_test") == {"display_name": "C"}
+
+
+def test_lazy_definitions_read_only_accessed_files(tmp_path):
+    setup_dir = definitions.SETUPS_DIR / DEFAULT_SETUP_ID
+    for name in ("units.json", "territories.json"):
+        shutil.copy(setup_dir / name, tmp_path / name)
+    lazy = load_static_definitions_lazy(data_dir=tmp_path)
+    unit_defs, territory_defs, *_ = load_static_definitions(setup_id=DEFAULT_SETUP_ID)
+    assert lazy.units == unit_defs
+    assert lazy.territories == territory_defs
+    # factions.json was never copied: only touching factions reads it
+    with pytest.raises(FileNotFoundError):
+        lazy.factions
@@ -0,0 +1,47 @@
+"""Tests for event factories: fixed payload shapes and to_dict/from_dict round-trip."""
+import pytest
+from backend.engine import events
+from backend.engine.events import GameEvent
+
+
+FACTORY_CASES = [
+    (events.phase_changed, ("purchase", "combat_move", "gondor"), events.PHASE_CHANGED),
+    (events.turn_started, (3, "gondor"), events.TURN_STARTED),
+    (events.turn_ended, (3, "gondor"), events.TURN_ENDED),
+    (events.turn_skipped, ("gondor",), events.TURN_SKIPPED),
+    (events.resources_changed, ("gondor", "power", 5, 8, "income"), events.RESOURCES_CHANGED),
+    (events.units_purchased, ("gondor", {"gondor_soldier": 2}, {"power": 6}), events.UNITS_PURCHASED),
+    (events.income_calculated, ("gondor", {"power": 4}, ["minas_tirith"]), events.INCOME_CALCULATED),
+    (events.income_collected, ("gondor", {"power": 4}, {"power": 12}), events.INCOME_COLLECTED),
+    (events.camp_placed, ("gondor", "osgiliath"), events.CAMP_PLACED),
+    (events.units_moved, ("gondor", "a", "b", ["u1"], "combat_move", "load", 1), events.UNITS_MOVED),
+    (events.combat_started, ("b", "gondor", ["u1"], "mordor", ["u2"]), events.COMBAT_STARTED),
+    (events.combat_ended, ("b", "attacker", "gondor", "mordor", ["u1"], [], 2), events.COMBAT_ENDED),
+    (events.units_retreated, ("gondor", "b", "a", ["u1"]), events.UNITS_RETREATED),
+    (events.territory_captured, ("b", "mordor", "gondor", ["u1"]), events.TERRITORY_CAPTURED),
+    (events.unit_destroyed, ("u2", "orc", "mordor", "b", "combat"), events.UNIT_DESTROYED),
+    (events.units_mobilized, ("gondor", "a", [{"unit_id": "gondor_soldier", "instance_id": "u3"}]), events.UNITS_MOBILIZED),
+    (events.victory, ("good", {"good": 5, "evil": 2}, 5, ["minas_tirith"]), events.VICTORY),
+]
+
+
+@pytest.mark.parametrize("factory,args,event_type", FACTORY_CASES)
+def test_factory_round_trips_through_dict(factory, args, event_type):
+    event = factory(*args)
+    assert event.type == event_type
+    data = event.to_dict()
+    assert data == {"type": event_type, "payload": event.payload}
+    assert GameEvent.from_dict(data) == event
+
+
+def test_combat_round_resolved_optional_keys_only_when_set():
+    base = ("b", 1, {}, {}, 0, 0, [], [], [], [], 1, 1, [], [])
+    payload = events.combat_round_resolved(*base).payload
+    assert "is_archer_prefire" not in payload and "terror_reroll_count" not in payload
+    payload = events.combat_round_resolved(
+        *base, is_archer_prefire=True, terror_reroll_count=2,
+        attacker_dice_siegework_split={3: {"ram": {"rolls": [1], "hits": 1}, "flex": {"rolls": [], "hits": 0}}},
+    ).payload
+    assert payload["is_archer_prefire"] is True
+    assert payload["terror_reroll_count"] == 2
+    assert payload["attacker_dice_siegework_split"] == {"3": {"ram": {"rolls": [1], "hits": 1}, "flex": {"rolls": [], "hits": 0}}}